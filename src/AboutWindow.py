@@ -21,7 +21,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QPixmap
 
-from Icons import createIcon
+from Icons import createIcon, cachedPixmap
 
 class AboutWindow(QDialog):
     def __init__(self, parent = None):
@@ -44,7 +44,8 @@ class AboutWindow(QDialog):
         layout.addLayout(contentLayout)
 
         logoLabel = QLabel()
-        logoLabel.setPixmap(createIcon(':logo', parent.config).pixmap(100,100))
+        logoLabel.setPixmap(cachedPixmap(createIcon(':logo', parent.config), ':logo',
+                                         parent.config, 100, 100))
         logoLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
         contentLayout.addWidget(logoLabel)
 
@@ -20,6 +20,8 @@ from widgets.BuildContent import BuildContent, BuildHeader
 from DataFields import Item
 from tools.ParallelExecution import ParallelLoopExecution, ParallelExecution
 from tools.SignalBlocker import SignalBlocker
+from tools.UpdateBlocker import UpdateBlocker
+from tools.Throttler import CallThrottler
 from tools.UndoRedo import UndoRedo
 from widgets.ContainerWidget import ContainerWidget
 
@@ -57,7 +59,11 @@ class BuildWidget(QWidget):
         self.categoryCombo.addItem('All categories')
         self.categoryCombo.setFixedHeight(30)
         self.categoryCombo.setMinimumContentsLength(25)
-        self.categoryCombo.currentTextChanged.connect(lambda: self.populateTable(self.categoryCombo.currentText()))
+        # Changing categories can fire several signals in a row (e.g. when the combo is
+        # repopulated); coalesce them into one table rebuild, as the test widget does.
+        self.repopulateThrottled = CallThrottler(
+            lambda: self.populateTable(self.categoryCombo.currentText()), 30)
+        self.categoryCombo.currentTextChanged.connect(self.repopulateThrottled)
 
         self.showDisabled = False
         self.showHideDisabledButton = QPushButton("")
@@ -153,21 +159,24 @@ class BuildWidget(QWidget):
 
             if allFound: return
         
-        # Remove all items.
-        for i in reversed(range(self.scrollLayout.count())): 
-            self.scrollLayout.itemAt(i).widget().setParent(None)
-        
-        # Add all items in order.
-        self.parent.items.sort()
-        categoriesList = []
-        for item in self.parent.items:
-            # Filter if the item is enabled or not and showDisabled is set.
-            if self.showDisabled or (not self.showDisabled and item.enabled):
-                # Filter by category.
-                if categoryFilter is None or self._filterItemByCategory(item, categoryFilter):
-                    self.scrollLayout.addWidget(CollapsibleBox(':logo', item, self.parent.config, BuildHeader, BuildContent, self))
-            if item.category not in categoriesList:
-                categoriesList.append(item.category)
+        # Remove and add all the boxes with repaints suspended, so the whole rebuild is laid
+        # out and drawn in one pass instead of once per box.
+        with UpdateBlocker(self.scrollContent):
+            # Remove all items.
+            for i in reversed(range(self.scrollLayout.count())):
+                self.scrollLayout.itemAt(i).widget().setParent(None)
+
+            # Add all items in order.
+            self.parent.items.sort()
+            categoriesList = []
+            for item in self.parent.items:
+                # Filter if the item is enabled or not and showDisabled is set.
+                if self.showDisabled or (not self.showDisabled and item.enabled):
+                    # Filter by category.
+                    if categoryFilter is None or self._filterItemByCategory(item, categoryFilter):
+                        self.scrollLayout.addWidget(CollapsibleBox(':logo', item, self.parent.config, BuildHeader, BuildContent, self))
+                if item.category not in categoriesList:
+                    categoriesList.append(item.category)
 
         # If no category is given, populate the category combo.
         if categoryFilter is None:
@@ -207,7 +216,7 @@ class BuildWidget(QWidget):
             content: BuildContent = args
             item: Item = content.item
 
-            content.outputCmdText.setText(item.result[0].output)
+            content.outputCmdText.setPlainText(item.result[0].output)
             content.outputReturnValue.setText(f"Return: {item.result[0].returnCode}\nExecution time: {item.result[0].executionTime:.2f} ms")
             content.outputCmdIndexCombo.setPlaceholderText("None")
             content.outputCmdIndexCombo.setCurrentIndex(0)
@@ -241,7 +250,7 @@ class BuildWidget(QWidget):
         elif action == 'run-all-items':
             boxes = []
             for i in range(self.scrollLayout.count()):
-                content: BuildContent = self.scrollLayout.itemAt(i).widget().content
+                content: BuildContent = self.scrollLayout.itemAt(i).widget().ensureContent()
                 # Only run those that are enabled and are shown on screen.
                 if content.item.isEnabled() and self._filterItemByCategory(content.item, self.categoryCombo.currentText()):
                     boxes.append(content)
@@ -281,7 +290,7 @@ class BuildWidget(QWidget):
                 return
             
             for i in range(self.scrollLayout.count()):
-                content = self.scrollLayout.itemAt(i).widget().content
+                content = self.scrollLayout.itemAt(i).widget().ensureContent()
                 # Only clean those shown on screen.
                 if self._filterItemByCategory(content.item, self.categoryCombo.currentText()):
                     self.runAction('clear-item', None, content) 
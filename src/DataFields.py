@@ -11,11 +11,12 @@
 # This project is licensed under the MIT License - see the LICENSE file for details.
 # **************************************************************************************************
 
-from dataclasses import dataclass, asdict, fields, field
+from dataclasses import dataclass, asdict, fields, field, replace
 import json
 from typing import List, ClassVar
 import subprocess
 import shlex    # To easily parse the arguments for a console.
+from sys import intern
 from time import perf_counter
 from ast import literal_eval
 from re import sub
@@ -65,7 +66,7 @@ class Operation():
     SAME = 0
     COMPARISON = 1
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class ResultCommand:
     output: str             = field(default="")
     returnCode: int         = field(default=None)
@@ -79,7 +80,7 @@ class ResultCommand:
         t0 = datetime.strptime(startExecutionTime, "%d/%m/%Y %H:%M:%S.%f")
         return str(t - t0)
 
-@dataclass
+@dataclass(slots=True)
 class ValidationCommand:
     operators: ClassVar[List[str]]  = ["==", "<>", "<", ">", "<=", ">=", "contain", "not contain"]
 
@@ -226,7 +227,7 @@ class ValidationCommand:
             ret = ret.replace('</b>', '</span>', 2)
         return ret
 
-@dataclass(eq=True)
+@dataclass(eq=True, slots=True)
 class Item:
     runningDirectory : ClassVar[str]    = ""
 
@@ -245,6 +246,22 @@ class Item:
 
     def __lt__(self, other):
         return self.id < other.id
+
+    def cloneForTest(self) -> 'Item':
+        # A test run only mutates the output containers and the test state, so there is no need
+        # to copy every field recursively: share the immutable inputs (strings, the build
+        # ResultCommands, which are never modified once created) and give the copy its own
+        # lists and validation command.
+        newItem = Item.__new__(Item)
+        for f in fields(Item):
+            setattr(newItem, f.name, getattr(self, f.name))
+        newItem.validationCmd = replace(self.validationCmd)
+        newItem.result = list(self.result)
+        newItem.testOutput = list(self.testOutput)
+        return newItem
+
+    def __deepcopy__(self, memo):
+        return self.cloneForTest()
     
     def clearTest(self):
         self.testResult = TestResult.NOTRUN
@@ -375,6 +392,15 @@ def saveTestToFile(testDataFields: TestDataFields, items: List[Item], filename:
     with open(filename, 'w') as file:
         json.dump([asdict(testDataFields), [asdict(item) for item in items]], file)
 
+# The identifying string fields repeat heavily across items (shared categories, boilerplate
+# commands), but the JSON parser gives every occurrence its own str object. Interning them makes
+# the repeats share one object, so equality checks on the filter paths are a pointer compare.
+def _internItemStrings(itemDict: dict) -> dict:
+    for key in ('name', 'category', 'runcode'):
+        if key in itemDict and type(itemDict[key]) is str:
+            itemDict[key] = intern(itemDict[key])
+    return itemDict
+
 def loadItemsFromFile(filename: str) -> List[Item]:
     with open(filename, 'r') as file:
         jsonList: List = json.load(file)
@@ -389,7 +415,8 @@ def loadItemsFromFile(filename: str) -> List[Item]:
         items = []
         for itemDict in jsonList[1]:
             # Filter the dictionary to only include valid fields
-            filteredDict = {k: v for k, v in itemDict.items() if k in itemFields}
+            filteredDict = _internItemStrings(
+                {k: v for k, v in itemDict.items() if k in itemFields})
             # Handle the result field types.
             if 'result' in filteredDict:
                 filteredDict['result'] = [ResultCommand(**res) for res in filteredDict['result']]
@@ -423,7 +450,8 @@ def loadTestFromFile(filename: str):
         items = []
         for itemDict in jsonList[1]:
             # Filter the dictionary to only include valid fields.
-            filteredDict = {k: v for k, v in itemDict.items() if k in itemFields}
+            filteredDict = _internItemStrings(
+                {k: v for k, v in itemDict.items() if k in itemFields})
 
             # Handle the result field types.
             if 'result' in filteredDict:
@@ -30,6 +30,7 @@ from SetupWidget import SetupWidget
 from BuildWidget import BuildWidget
 from TestWidget import TestWidget
 from tools.UndoRedo import UndoRedo
+from tools.TestResultCache import TestResultCache
 import tools.TestExporter as Exporter
 
 from widgets.ContainerWidget import ContainerWidget
@@ -50,6 +51,8 @@ class GUI(QMainWindow):
         self.items: List[Item] = []
         # Field to save the currently opened file.
         self.currentFile: Optional[str] = None
+        # Verdicts of past test runs, keyed by a digest of each item's inputs.
+        self.testResultCache = TestResultCache()
         # Mode of the current program.
         self.currentMode: str = None
         # The currently shown widget on the center of the GUI.
@@ -148,6 +151,10 @@ class GUI(QMainWindow):
         programSettAction.setShortcut("Ctrl+R")
         programSettAction.setStatusTip("Configure the program behavior.")
         programSettAction.triggered.connect(self.changeConfig)
+
+        clearCacheAction = settingsMenu.addAction('Clear test &cache')
+        clearCacheAction.setStatusTip("Forget the stored test verdicts so every test runs again.")
+        clearCacheAction.triggered.connect(self.clearTestCache)
         
         settingsMenu.addSeparator()
 
@@ -341,6 +348,10 @@ class GUI(QMainWindow):
             action.setEnabled(True)
             action.setChecked(selected)
 
+    def clearTestCache(self):
+        self.testResultCache.clear()
+        self.statusBar.showMessage("Test cache cleared.", 3000)
+
     def changeConfig(self):
         settingsWindow = SettingsWindow(self.config, self)
         settingsWindow.exec()
@@ -399,6 +410,9 @@ class GUI(QMainWindow):
             # The scripts must be on the same folder as the .vvf file.
             Item.runningDirectory= os.path.dirname(fileName)
 
+            # Verdicts cached on a previous session of this project.
+            self.testResultCache.loadFromFile(fileName)
+
             self.changeMode('setup')
 
             self.setupWidget.runAction('populate-table', None)
@@ -432,7 +446,13 @@ class GUI(QMainWindow):
                 else:
                     return False
 
+            # An edit coalescing in the setup pane's throttler has not reached the items yet;
+            # run it now so the file never misses the last keystrokes.
+            if self.setupWidget.detailsBuilt:
+                self.setupWidget.updateTableFromDetailsThrottled.flush()
+
             DataFields.saveItemsToFile(self.projectDataFields, self.items, self.currentFile)
+            self.testResultCache.saveToFile(self.currentFile)
             self.statusBarPermanent.setText(f"Current file: <b>{self.currentFile}</b>")
             self.statusBar.showMessage("File saved.", 3000)
             return True
@@ -457,6 +477,7 @@ class GUI(QMainWindow):
 
         # Delete items.
         self.items.clear()
+        self.testResultCache.clear()
         self.testWidget.runAction('clear-all-tests', None, False)
 
         self.changeMode(None)
@@ -19,6 +19,28 @@ from PyQt6.QtCore import QByteArray, QBuffer, QIODevice, QFile, Qt
 # Don't remove this "unused" import, contains the resource images.
 import ResourcePacket
 
+# Rendered pixmaps keyed by (icon path, color). The same handful of icons gets requested for
+# every row of the tables, and rendering the SVG each time is by far the expensive part.
+_pixmapCache = {}
+
+# Pixmaps already scaled to their display size, keyed by icon, color theme and size. Shared
+# process-wide so every widget asking for the same icon at the same size reuses one rasterized
+# pixmap instead of scaling the icon again.
+_scaledPixmapCache = {}
+
+def cachedPixmap(icon: QIcon, iconName: str, theme, width: int, height: int) -> QPixmap:
+    if theme is None:
+        color = None
+    else:
+        color = theme if type(theme) is str else theme.colorTheme
+
+    key = (iconName, color, width, height)
+    pixmap = _scaledPixmapCache.get(key)
+    if pixmap is None:
+        pixmap = icon.pixmap(width, height)
+        _scaledPixmapCache[key] = pixmap
+    return pixmap
+
 class TrackableIcon(QIcon):
     _instances = []
 
@@ -93,6 +115,10 @@ def createIcon(iconPath: str, theme = None) -> TrackableIcon | QIcon:
     return TrackableIcon(iconPath, recolorSVG(iconPath, color))
 
 def recolorSVG(icon_path: str, color: str) -> QIcon:
+    cachedPixmap = _pixmapCache.get((icon_path, color))
+    if cachedPixmap is not None:
+        return QIcon(cachedPixmap)
+
     # Load the SVG data from the resource
     file = QFile(icon_path)
     if not file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
@@ -131,4 +157,5 @@ def recolorSVG(icon_path: str, color: str) -> QIcon:
 
     # Convert QImage to QPixmap for display
     pixmap = QPixmap.fromImage(image)
+    _pixmapCache[(icon_path, color)] = pixmap
     return QIcon(pixmap)
\ No newline at end of file
@@ -13,18 +13,14 @@
 
 import sys
 from GUI import GUI
+from SettingsWindow import ADDITIONAL_QSS
 from PyQt6.QtWidgets import QApplication
 import qdarktheme
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
-    qss = """
-    ContainerWidget {
-        background-color: transparent;
-    }
-    """
-    qdarktheme.setup_theme("auto", additional_qss=qss)
+    qdarktheme.setup_theme("auto", additional_qss=ADDITIONAL_QSS)
 
     window = GUI()
     window.show()
@@ -12,13 +12,13 @@
 # **************************************************************************************************
 
 from PyQt6.QtWidgets import (
-    QVBoxLayout, QHBoxLayout, QFormLayout, QCheckBox, QDialog, QPushButton
+    QVBoxLayout, QHBoxLayout, QFormLayout, QCheckBox, QDialog, QPushButton, QApplication
 )
 
 from widgets.CollapsibleBox import CollapsibleBox
 
-from PyQt6.QtCore import Qt
-from dataclasses import dataclass, field, fields 
+from PyQt6.QtCore import Qt, QTimer
+from dataclasses import dataclass, field, fields, replace
 import qdarktheme
 from Icons import TrackableIcon
 
@@ -27,6 +27,28 @@ class ProgramConfig:
     validateCommands: bool = field(default=False)
     colorTheme      : str  = field(default="dark")
 
+# Extra rules appended to the qdarktheme stylesheet. Also used by Main.py for the initial theme.
+ADDITIONAL_QSS = """
+ContainerWidget {
+    background-color: transparent;
+}
+"""
+
+# qdarktheme.setup_theme() re-parses its whole theme definition on every call. The resulting
+# palette and stylesheet only depend on the theme name, so cache them and apply them directly.
+# The caches are filled lazily because this module gets imported before the QApplication exists.
+_themePaletteCache = {}
+_themeQssCache = {}
+
+def applyCachedTheme(theme: str):
+    if theme not in _themePaletteCache:
+        _themePaletteCache[theme] = qdarktheme.load_palette(theme)
+        _themeQssCache[theme] = qdarktheme.load_stylesheet(theme) + ADDITIONAL_QSS
+
+    app = QApplication.instance()
+    app.setPalette(_themePaletteCache[theme])
+    app.setStyleSheet(_themeQssCache[theme])
+
 class SettingsWindow(QDialog):
     def __init__(self, config: ProgramConfig, parent = None):
         super().__init__(parent)
@@ -45,8 +67,13 @@ class SettingsWindow(QDialog):
         # Create a copy of the original config and modify that one. When "Apply" is pressed, pass 
         # the configuration to the original.
         self.originalConfig = config
-        self.config = ProgramConfig(**config.__dict__)
-        
+        self.config = replace(config)
+
+        # Set when a theme apply is already scheduled on the event loop, so that rapid theme
+        # button clicks coalesce into a single redraw.
+        self.themeApplyPending = False
+
+
         layout = QVBoxLayout()
 
         optionsLayout = QFormLayout()
@@ -96,6 +123,14 @@ class SettingsWindow(QDialog):
         self.setLayout(layout)
 
     def changeTheme(self, theme):
+        # Clicking the already selected theme would trigger a full redraw for nothing.
+        if self.config.colorTheme == theme:
+            if theme == "dark":
+                self.darkTheme.setChecked(True)
+            else:
+                self.lightTheme.setChecked(True)
+            return
+
         self.config.colorTheme = theme
 
         if self.config.colorTheme == "dark":
@@ -105,12 +140,26 @@ class SettingsWindow(QDialog):
             self.darkTheme.setChecked(False)
             self.lightTheme.setChecked(True)
 
+        self.scheduleApplyTheme()
+
+    def scheduleApplyTheme(self):
+        # Defer the theme apply to the next event loop tick. Several theme changes within the
+        # same tick will only redraw the GUI once.
+        if self.themeApplyPending:
+            return
+        self.themeApplyPending = True
+        QTimer.singleShot(0, self.flushApplyTheme)
+
+    def flushApplyTheme(self):
+        self.themeApplyPending = False
         self.applyTheme()
 
     def applyChanges(self):
-        for field in fields(self.config):
-            setattr(self.originalConfig, field.name, getattr(self.config, field.name))
-        
+        # The config only has two fields: write them directly instead of reflecting over
+        # fields() with getattr/setattr. The checkbox is read once, here, on Apply.
+        self.originalConfig.validateCommands = self.validateCommandsCheck.isChecked()
+        self.originalConfig.colorTheme = self.config.colorTheme
+
         self.applyTheme()
 
         # Close the window.
@@ -126,7 +175,14 @@ class SettingsWindow(QDialog):
         self.close()
 
     def applyTheme(self):
-        qdarktheme.setup_theme(self.config.colorTheme)
-        TrackableIcon.recolorAllIcons(self.config)
-        for collaps in self.parent.findChildren(CollapsibleBox):
-            collaps.setStyle()
\ No newline at end of file
+        # Disable repaints while the stylesheet, the icons and the boxes are being restyled, so
+        # the whole theme change is drawn in a single frame.
+        self.parent.setUpdatesEnabled(False)
+        try:
+            applyCachedTheme(self.config.colorTheme)
+            TrackableIcon.recolorAllIcons(self.config)
+            for collaps in self.parent.findChildren(CollapsibleBox):
+                collaps.setStyle(self.config.colorTheme)
+        finally:
+            self.parent.setUpdatesEnabled(True)
+            self.parent.update()
\ No newline at end of file
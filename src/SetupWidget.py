@@ -12,13 +12,15 @@
 # **************************************************************************************************
 
 from PyQt6.QtWidgets import (
-    QTableWidget, QCheckBox, QVBoxLayout, QWidget, QHeaderView,
-    QLabel, QFormLayout, QSplitter, QHBoxLayout, QPushButton, QTableWidgetItem, QSizePolicy
+    QTableView, QCheckBox, QVBoxLayout, QWidget, QHeaderView,
+    QLabel, QFormLayout, QSplitter, QHBoxLayout, QPushButton, QSizePolicy
+)
+from PyQt6.QtCore import (
+    Qt, QEvent, QTimer, QSize, QLocale, QAbstractTableModel, QModelIndex, pyqtSlot
 )
-from PyQt6.QtCore import Qt, QEvent, QTimer, QSize
 from PyQt6.QtGui import QIntValidator
 
-from copy import deepcopy
+from dataclasses import replace
 from typing import Optional
 
 from DataFields import Item
@@ -26,12 +28,147 @@ from DataFields import Item
 from tools.UndoRedo import UndoRedo
 from widgets.LabeledEditLine import LabeledLineEdit
 from widgets.CodeTextField import CodeTextField
-from widgets.TableCell import TableCell
 from widgets.ContainerWidget import ContainerWidget
 from SettingsWindow import ProgramConfig
 
 from Icons import createIcon
 from tools.SignalBlocker import SignalBlocker
+from tools.Throttler import CallThrottler
+
+# One validator shared by every integer field. Bounded so Qt rejects inputs that would
+# otherwise become Python bigints, and pinned to the C locale to skip per-keystroke locale
+# lookups.
+_intFieldValidator = QIntValidator(0, 2**31 - 1)
+_intFieldValidator.setLocale(QLocale.c())
+
+class ItemsTableModel(QAbstractTableModel):
+    # The model serves the items of the GUI directly, without storing a copy per cell like a
+    # QTableWidget would do.
+
+    columnHeaders = ["ID", "Name", "Category", "Repetitions", "Enabled"]
+    columnStatusTips = ['The ID/order of execution of this test case.',
+        'The name or descriptor of this test case.',
+        'The group of this test case.',
+        'The number of times the code of this test case will be run.',
+        'Enables/disables this test case during the build process.']
+
+    def __init__(self, setupWidget, parent=None):
+        super().__init__(parent)
+        self.setupWidget = setupWidget
+
+    @property
+    def items(self):
+        # The GUI may replace the whole item list when a file is opened, so fetch it every time.
+        return self.setupWidget.parent.items
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 5
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.items):
+            return None
+
+        item = self.items[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            match index.column():
+                case 0: return str(item.id)
+                case 1: return item.name
+                case 2: return item.category
+                case 3: return str(item.repetitions)
+        elif role == Qt.ItemDataRole.CheckStateRole and index.column() == 4:
+            return Qt.CheckState.Checked if item.enabled else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.row() >= len(self.items):
+            return False
+
+        item = self.items[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole and index.column() == 4:
+            editedField = ('enabled', item.enabled)
+            item.enabled = (Qt.CheckState(value) == Qt.CheckState.Checked)
+        elif role == Qt.ItemDataRole.EditRole:
+            match index.column():
+                case 0:
+                    # Parse once; checkIDOk takes the int so the string isn't converted twice.
+                    try:
+                        newId = int(value)
+                    except ValueError:
+                        return False
+                    if self.setupWidget.checkIDOk(newId) != 0:
+                        return False
+                    editedField = ('id', item.id)
+                    self.setupWidget.usedIds.discard(item.id)
+                    item.id = newId
+                    self.setupWidget.usedIds.add(newId)
+                    self.setupWidget.maxId = max(self.setupWidget.maxId, newId)
+                case 1:
+                    if not value:
+                        return False
+                    editedField = ('name', item.name)
+                    item.name = value
+                case 2:
+                    if not value:
+                        return False
+                    editedField = ('category', item.category)
+                    item.category = value
+                case 3:
+                    try:
+                        repetitions = int(value)
+                    except ValueError:
+                        return False
+                    if repetitions <= 0:
+                        return False
+                    editedField = ('repetitions', item.repetitions)
+                    item.repetitions = repetitions
+                    # If the number of repetitions is different, clear results.
+                    if len(item.result) != item.repetitions:
+                        item.result.clear()
+                case _:
+                    return False
+        else:
+            return False
+
+        # Only the changed field and its previous value go onto the undo stack, not a full
+        # snapshot of the Item.
+        UndoRedo.addAction('undo', ('item-edit', item) + editedField)
+
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        baseFlags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 4:
+            return baseFlags | Qt.ItemFlag.ItemIsUserCheckable
+        return baseFlags | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.columnHeaders[section]
+            elif role == Qt.ItemDataRole.StatusTipRole:
+                return self.columnStatusTips[section]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        match column:
+            case 0: key = lambda it: it.id
+            case 1: key = lambda it: it.name
+            case 2: key = lambda it: it.category
+            case 3: key = lambda it: it.repetitions
+            case 4: key = lambda it: it.enabled
+            case _: return
+
+        self.layoutAboutToBeChanged.emit()
+        self.items.sort(key=key, reverse=(order == Qt.SortOrder.DescendingOrder))
+        self.layoutChanged.emit()
+
+    def refreshAll(self):
+        self.beginResetModel()
+        self.endResetModel()
 
 class SetupWidget(QWidget):
     def __init__(self, parent=None):
@@ -70,43 +207,51 @@ class SetupWidget(QWidget):
         buttonLayout.addWidget(self.removeButton)
         buttonLayout.addStretch()
 
-        # Create the table widget
-        self.tableWidget = QTableWidget()
-        # self.tableWidget.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Expanding)
-        
+        # Create the table view and its model, served directly from the items of the GUI.
+        self.tableView = QTableView()
+        self.model = ItemsTableModel(self)
+        self.tableView.setModel(self.model)
+
         # Create a vertical layout for the table and buttons
         tableLayout = QVBoxLayout()
         tableLayout.addWidget(buttonWidget)
-        tableLayout.addWidget(self.tableWidget)
+        tableLayout.addWidget(self.tableView)
 
         tableContainer = ContainerWidget()
         tableContainer.setLayout(tableLayout)
         self.splitter.addWidget(tableContainer)
 
         # Enable sorting
-        self.tableWidget.setSortingEnabled(True)
+        self.tableView.setSortingEnabled(True)
 
-        self.tableWidget.horizontalHeader().setSortIndicatorShown(True)
-        self.tableWidget.horizontalHeader().setSectionsClickable(True)
-        self.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.tableView.horizontalHeader().setSortIndicatorShown(True)
+        self.tableView.horizontalHeader().setSectionsClickable(True)
+        self.tableView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         # Connect cell click to show details
         self.currentRow = 0
-        self.tableWidget.cellClicked.connect(self.showDetails)
-        self.tableWidget.cellChanged.connect(self.updateDetailsFromTable)
-        self.tableWidget.currentCellChanged.connect(self.updateDetailsFromSelection)
-        self.tableWidget.resizeEvent = self.onResizeWindow
-        self.tableWidget.viewport().installEventFilter(self)
+        self.updatingFromDetails = False
+        # IDs currently in use, kept in sync with the item list so checkIDOk doesn't have to
+        # scan every item on each keystroke of the ID field. maxId tracks the highest of them
+        # so new items get an ID without scanning the whole list.
+        self.usedIds = set()
+        self.maxId = -1
+        self.tableView.clicked.connect(self.onCellClicked)
+        self.model.dataChanged.connect(self.updateDetailsFromTable)
+        self.tableView.selectionModel().currentRowChanged.connect(self.updateDetailsFromSelection)
+        # Dragging a window edge fires a stream of resize events; recompute the column widths
+        # only once the stream settles.
+        self.updateColumnWidthThrottled = CallThrottler(self.updateColumnWidth, 50)
+        self.tableView.resizeEvent = self.onResizeWindow
+        self.tableView.viewport().installEventFilter(self)
 
         # Set table properties
-        self.tableWidget.verticalHeader().setVisible(False)  # Remove row numbers
-        # self.tableWidget.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        # self.tableWidget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.tableView.verticalHeader().setVisible(False)  # Remove row numbers
 
         # Create the details widget with a header
         self.detailsWidget = ContainerWidget()
         self.splitter.addWidget(self.detailsWidget)
-        
+
         # Create a form layout for the details widget
         self.formLayout = QFormLayout()
         self.detailsWidget.setLayout(self.formLayout)
@@ -114,14 +259,29 @@ class SetupWidget(QWidget):
         # Initially hide the details widget
         self.detailsWidget.hide()
 
+        # The detail fields (and the code editor, the heaviest of them) are only built the
+        # first time a row gets clicked.
+        self.detailsBuilt = False
+
+    def buildDetailsPane(self):
+        # Deferred part of the constructor: creates the detail fields on first use so that
+        # browsing the table never pays for a code editor it doesn't show.
+        if self.detailsBuilt:
+            return
+        self.detailsBuilt = True
+
         # Add a header to the details widget
         header = QLabel("Item Details")
         header.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
         self.formLayout.addRow(header)
 
         # Add fields to the form layout
-        self.idField = LabeledLineEdit(validator=QIntValidator())
-        self.idField.lineEdit.textChanged.connect(self.validateID)
+        self.idField = LabeledLineEdit(validator=_intFieldValidator)
+        # Throttle the keystroke handlers: fast typing coalesces into one validation pass
+        # instead of one full round-trip per character.
+        self.validateIDThrottled = CallThrottler(self.validateID)
+        self.updateTableFromDetailsThrottled = CallThrottler(self.updateTableFromDetails)
+        self.idField.lineEdit.textChanged.connect(self.validateIDThrottled)
         self.idField.setStatusTip('Set the ID/order of execution of this test case.')
         self.formLayout.addRow("ID:", self.idField)
 
@@ -133,7 +293,7 @@ class SetupWidget(QWidget):
         self.categoryField.setStatusTip('Set the group this test case belong to.')
         self.formLayout.addRow("Category:", self.categoryField)
 
-        self.repetitionsField = LabeledLineEdit(validator=QIntValidator())
+        self.repetitionsField = LabeledLineEdit(validator=_intFieldValidator)
         self.repetitionsField.setStatusTip('Set the number of times this test\' code will be run for.')
         self.formLayout.addRow("Repetitions:", self.repetitionsField)
 
@@ -146,59 +306,68 @@ class SetupWidget(QWidget):
         self.formLayout.addRow("Command:", self.codeField)
 
         # Connect changes in the detail fields to update the table
-        self.idField.lineEdit.textEdited.connect(self.updateTableFromDetails)
-        self.nameField.lineEdit.textEdited.connect(self.updateTableFromDetails)
-        self.categoryField.lineEdit.textEdited.connect(self.updateTableFromDetails)
-        self.repetitionsField.lineEdit.textEdited.connect(self.updateTableFromDetails)
-        self.enabledField.toggled.connect(self.updateTableFromDetails)
-        self.codeField.textChanged.connect(self.updateTableFromDetails)
-    
+        self.idField.lineEdit.textEdited.connect(self.updateTableFromDetailsThrottled)
+        self.nameField.lineEdit.textEdited.connect(self.updateTableFromDetailsThrottled)
+        self.categoryField.lineEdit.textEdited.connect(self.updateTableFromDetailsThrottled)
+        self.repetitionsField.lineEdit.textEdited.connect(self.updateTableFromDetailsThrottled)
+        self.enabledField.toggled.connect(self.updateTableFromDetailsThrottled)
+        self.codeField.textChanged.connect(self.updateTableFromDetailsThrottled)
+
+        # Empty-field warnings are refreshed when a field is left, not on every keystroke.
+        self.idField.lineEdit.editingFinished.connect(self.checkEmptyFields)
+        self.nameField.lineEdit.editingFinished.connect(self.checkEmptyFields)
+        self.categoryField.lineEdit.editingFinished.connect(self.checkEmptyFields)
+        self.repetitionsField.lineEdit.editingFinished.connect(self.checkEmptyFields)
+
     def populateTable(self):
-        self.tableWidget.setRowCount(len(self.parent.items))
-        self.tableWidget.setColumnCount(5)
-        columnHeaders = ["ID", "Name", "Category", "Repetitions", "Enabled"]
-        columnStatusTips = ['The ID/order of execution of this test case.',
-            'The name or descriptor of this test case.',
-            'The group of this test case.',
-            'The number of times the code of this test case will be run.',
-            'Enables/disables this test case during the build process.']
-        
-        for col, header in enumerate(columnHeaders):
-            item = QTableWidgetItem(header)
-            item.setStatusTip(columnStatusTips[col])
-            self.tableWidget.setHorizontalHeaderItem(col, item)
-
-        for row, item in enumerate(self.parent.items):
-            self.tableWidget.setItem(row, 0, TableCell(str(item.id), item))
-            self.tableWidget.setItem(row, 1, TableCell(item.name, item))
-            self.tableWidget.setItem(row, 2, TableCell(item.category, item))
-            self.tableWidget.setItem(row, 3, TableCell(str(item.repetitions), item))
-            
-            checkbox = QCheckBox()
-            checkbox.setChecked(item.enabled)
-            checkbox.stateChanged.connect(lambda state, associatedItem=item: self.updateEnabledCheckboxFromTable(associatedItem, state))
-            self.tableWidget.setCellWidget(row, 4, checkbox)
+        self.usedIds = {it.id for it in self.parent.items}
+        self.maxId = max(self.usedIds, default=-1)
+
+        # A model reset is already a single batched change; disabling viewport updates on top
+        # of it makes the repopulation paint exactly once.
+        self.tableView.setUpdatesEnabled(False)
+        try:
+            self.model.refreshAll()
+        finally:
+            self.tableView.setUpdatesEnabled(True)
 
         # This gives some time to the UI to update.
         QTimer.singleShot(0, self.updateColumnWidth)
 
+    # Percentage of the table width assigned to each column.
+    columnWidthPercentages = (5, 50, 20, 15, 10)
+
     def onResizeWindow(self, event):
-        self.updateColumnWidth()
+        self.updateColumnWidthThrottled()
         event.accept()
 
     def updateColumnWidth(self):
-        columnWidthPercentages = [0.05, 0.5, 0.2, 0.15, 0.1]
-        tableWidth = self.tableWidget.viewport().width()
-        for i, width in enumerate(columnWidthPercentages):
-            self.tableWidget.setColumnWidth(i, int(tableWidth * width))
+        tableWidth = self.tableView.viewport().width()
+        # Block the header so the five width changes don't cascade into intermediate
+        # sectionResized handling.
+        with SignalBlocker(self.tableView.horizontalHeader()):
+            for i, width in enumerate(self.columnWidthPercentages):
+                self.tableView.setColumnWidth(i, tableWidth * width // 100)
+
+    @pyqtSlot(QModelIndex)
+    def onCellClicked(self, index):
+        self.showDetails(index.row(), index.column())
 
     def showDetails(self, row, column = -1):
+        # Commit any edit still sitting in the throttlers before currentRow moves and the
+        # fields are refilled; otherwise a keystroke made within the coalescing window of a
+        # row change would be silently dropped.
+        if self.detailsBuilt:
+            self.updateTableFromDetailsThrottled.flush()
+            self.validateIDThrottled.flush()
         self.currentRow = row
         item = self.getItemByRow(row)
         if item is None:
             return
 
-        # To disable the updateTableFromDetails call on 'textEdited' change. 
+        self.buildDetailsPane()
+
+        # To disable the updateTableFromDetails call on 'textEdited' change.
         with SignalBlocker(self.idField, self.nameField, self.categoryField, self.repetitionsField, self.enabledField, self.codeField):
             self.idField.setText(str(item.id))
             self.nameField.setText(item.name)
@@ -210,11 +379,13 @@ class SetupWidget(QWidget):
         self.detailsWidget.show()
 
         # Highlight the entire row
-        self.tableWidget.selectRow(row)
+        with SignalBlocker(self.tableView.selectionModel()):
+            self.tableView.selectRow(row)
 
         # Add warning labels for empty fields
         self.checkEmptyFields()
 
+    @pyqtSlot()
     def checkEmptyFields(self):
         self.idField.clearError()
         self.nameField.clearError()
@@ -230,72 +401,48 @@ class SetupWidget(QWidget):
         if not self.repetitionsField.text():
             self.repetitionsField.setError("Repetitions cannot be empty.")
 
-    def updateDetailsFromSelection(self, currentRow, currentColumn, previousRow, previousColumn):
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def updateDetailsFromSelection(self, current, previous):
         # Ensure a valid row is selected
-        if currentRow != -1 and currentRow < len(self.parent.items):
-            with SignalBlocker(self.tableWidget):
-                self.showDetails(currentRow, currentColumn)
+        if current.isValid() and current.row() < len(self.parent.items):
+            self.showDetails(current.row(), current.column())
         else:
             self.detailsWidget.hide()
 
-    def updateDetailsFromTable(self, row, column):
-        if row != self.currentRow:
+    @pyqtSlot(QModelIndex, QModelIndex, 'QList<int>')
+    def updateDetailsFromTable(self, topLeft, bottomRight, roles=None):
+        # The model already validated and wrote the edit into the Item; refresh the details pane
+        # if the currently shown row was touched.
+        if self.updatingFromDetails:
             return
-        
-        with SignalBlocker(self.tableWidget):
-            item = self.getItemByRow(row)
-            if item is None:
-                return
-            
-            if column == 0:
-                inputID = self.tableWidget.item(row, column).text()
-                if self.checkIDOk(inputID) == 0: 
-                    item.id = int(self.tableWidget.item(row, column).text())
-                else:
-                    # Restore the original value
-                    self.tableWidget.item(row, column).setText(str(item.id))
-            elif column == 1:
-                if not self.tableWidget.item(row, column).text():
-                    self.tableWidget.item(row, column).setText(item.name)
-                else:
-                    item.name = self.tableWidget.item(row, column).text()
-            elif column == 2:
-                if not self.tableWidget.item(row, column).text():
-                    self.tableWidget.item(row, column).setText(item.category)
-                else:
-                    item.category = self.tableWidget.item(row, column).text()
-            elif column == 3:
-                try:
-                    inputInt = int(self.tableWidget.item(row, column).text())
-                except ValueError:
-                    inputInt = None
-
-                if inputInt is not None and inputInt > 0:
-                    item.repetitions = inputInt
-                    # If the number of repetitions is different, clear results.
-                    if len(item.result) != item.repetitions:
-                        item.result.clear()
-                else:
-                    self.tableWidget.item(row, column).setText(str(item.repetitions))
-            
-    def updateTableFromDetails(self):
-        # Update error messages.
-        self.checkEmptyFields()
+        if topLeft.row() <= self.currentRow <= bottomRight.row():
+            self.showDetails(self.currentRow)
 
+    def updateTableFromDetails(self):
         item = self.getItemByRow(self.currentRow)
         if item is None:
             return
-        
+
         inputID = self.idField.text()
         if inputID != str(item.id):
-            if self.checkIDOk(inputID) == 0: 
-                item.id = inputID
+            # Parse the ID once and store it as an int: storing the raw string here would break
+            # the set-based checkIDOk and every str(item.id) comparison down the line.
+            try:
+                newId = int(inputID)
+            except ValueError:
+                self.idField.setError("This field must be a number.")
+                return
+            if self.checkIDOk(newId) == 0:
+                self.usedIds.discard(item.id)
+                item.id = newId
+                self.usedIds.add(newId)
+                self.maxId = max(self.maxId, newId)
             else:
                 self.idField.setError("This field must be a number.")
                 return
 
         item.name = self.nameField.text()
-        
+
         item.category = self.categoryField.text()
 
         try:
@@ -306,12 +453,12 @@ class SetupWidget(QWidget):
                 if len(item.result) != item.repetitions:
                     item.result.clear()
             else:
-                self.repetitionsField.setError("This field must be greater than zero.")    
+                self.repetitionsField.setError("This field must be greater than zero.")
                 return
         except ValueError:
             self.repetitionsField.setError("This field must be a number.")
-            return        
-        
+            return
+
         item.enabled = self.enabledField.isChecked()
 
         inputRunCode = self.codeField.getCommand(self.parent.config.validateCommands)
@@ -323,22 +470,16 @@ class SetupWidget(QWidget):
                 item.result.clear()
             item.runcode = inputRunCode
 
-        self.tableWidget.item(self.currentRow, 0).setText(str(item.id))
-        self.tableWidget.item(self.currentRow, 1).setText(item.name)
-        self.tableWidget.item(self.currentRow, 2).setText(item.category)
-        self.tableWidget.item(self.currentRow, 3).setText(str(item.repetitions))
-        self.tableWidget.cellWidget(self.currentRow, 4).setChecked(item.enabled)
-        
-    def updateEnabledCheckboxFromTable(self, associatedItem, state):
-        associatedItem.enabled = (state == Qt.CheckState.Checked.value)
-        self.enabledField.setChecked(associatedItem.enabled)
-
-        # Get the row index by searching for the associatedItem on the table.
-        for row in range(self.tableWidget.rowCount()):
-            if self.tableWidget.item(row,0).text() == str(associatedItem.id):
-                # Update the row when clicking on the checkbox.
-                self.currentRow = row
-                self.showDetails(row)
+        # Repaint the whole row in a single pass. The guard stops updateDetailsFromTable from
+        # rewriting the details pane while the user is typing on it.
+        self.updatingFromDetails = True
+        try:
+            topLeft = self.model.index(self.currentRow, 0)
+            bottomRight = self.model.index(self.currentRow, 4)
+            self.model.dataChanged.emit(topLeft, bottomRight,
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.CheckStateRole])
+        finally:
+            self.updatingFromDetails = False
 
     # Check that the ID is not being used.
     def checkIDOk(self, newID) -> int:
@@ -350,17 +491,16 @@ class SetupWidget(QWidget):
 
         if newID < 0: return 3
 
-        for item in self.parent.items:
-            if item.id == newID:
-                return 2
+        if newID in self.usedIds:
+            return 2
         return 0
 
     def validateID(self):
         newID = self.idField.text()
         if newID == str(self.getItemByRow(self.currentRow).id):
             self.idField.clearError()
-            return 
-        
+            return
+
         match self.checkIDOk(newID):
             case 0: self.idField.clearError()
             case 1: self.idField.setError("This ID is not a number.")
@@ -368,7 +508,7 @@ class SetupWidget(QWidget):
             case 3: self.idField.setError("The ID must be positive or zero.")
 
     def deselectAll(self):
-        self.tableWidget.clearSelection()
+        self.tableView.clearSelection()
         self.detailsWidget.hide()
 
     def keyPressEvent(self, event):
@@ -377,74 +517,96 @@ class SetupWidget(QWidget):
         super().keyPressEvent(event)
 
     def eventFilter(self, source, event):
-        if event.type() == QEvent.Type.MouseButtonPress and source is self.tableWidget.viewport():
-            if not self.tableWidget.indexAt(event.pos()).isValid():
+        if event.type() == QEvent.Type.MouseButtonPress and source is self.tableView.viewport():
+            if not self.tableView.indexAt(event.pos()).isValid():
                 self.deselectAll()
         return super().eventFilter(source, event)
 
     def addItem(self, newItem):
-        # Find the maximum current ID
         if newItem is None:
             newItem = Item()
-            newItem.id = max(item.id for item in self.parent.items) + 1 if self.parent.items else 0
+            newItem.id = self.maxId + 1
         elif type(newItem) is Item:
             pass
         else:
             raise Exception(f"Unexpected type received ({type(newItem)})")
 
+        row = len(self.parent.items)
+        self.model.beginInsertRows(QModelIndex(), row, row)
         self.parent.items.append(newItem)
-        self.tableWidget.setRowCount(len(self.parent.items))
-        row = self.tableWidget.rowCount() - 1
-        self.tableWidget.setItem(row, 0, TableCell(str(newItem.id), newItem))
-        self.tableWidget.setItem(row, 1, TableCell(newItem.name, newItem))
-        self.tableWidget.setItem(row, 2, TableCell(newItem.category, newItem))
-        self.tableWidget.setItem(row, 3, TableCell(str(newItem.repetitions), newItem))
-        checkbox = QCheckBox()
-        checkbox.setChecked(newItem.enabled)
-        checkbox.stateChanged.connect(lambda state, associatedItem=newItem: self.updateEnabledCheckboxFromTable(associatedItem, state))
-        self.tableWidget.setCellWidget(row, 4, checkbox)
-        self.tableWidget.scrollToBottom()
+        self.model.endInsertRows()
+        self.usedIds.add(newItem.id)
+        self.maxId = max(self.maxId, newItem.id)
+        self.tableView.scrollToBottom()
 
         return newItem
 
+    def addItemsBatch(self, newItems):
+        # Insert a whole list of items with a single row insertion instead of one model update
+        # per item. Used for replay/import paths that add many items at once.
+        if not newItems:
+            return newItems
+
+        start = len(self.parent.items)
+        self.model.beginInsertRows(QModelIndex(), start, start + len(newItems) - 1)
+        self.parent.items.extend(newItems)
+        self.model.endInsertRows()
+
+        for newItem in newItems:
+            self.usedIds.add(newItem.id)
+            self.maxId = max(self.maxId, newItem.id)
+        self.tableView.scrollToBottom()
+        return newItems
+
     def removeItem(self, selectedItem):
+        selectedIndexes = self.tableView.selectionModel().selectedIndexes()
+        selectedRow = selectedIndexes[0].row() if selectedIndexes else -1
+
         # If no item is passed, try to get the selected item from the table.
         if selectedItem is None:
-            selectedItem = self.tableWidget.selectedItems()
-            if selectedItem:
-                selectedItemID = int(selectedItem[0].text())
-                for it in self.parent.items:
-                    if it.id == selectedItemID:
-                        selectedItem = it
-                        break
-            else:
+            if selectedRow == -1:
                 self.parent.statusBar.showMessage("Nothing to remove.", 3000)
                 return
+            row = selectedRow
+            selectedItem = self.getItemByRow(row)
+        elif selectedRow != -1 and self.getItemByRow(selectedRow) is selectedItem:
+            # The item to remove is the selected one, so its row is already known.
+            row = selectedRow
+        else:
+            try:
+                row = self.parent.items.index(selectedItem)
+            except ValueError:
+                return
 
-        # Get the row of the item from the table by its ID.
-        for i in range(self.tableWidget.rowCount()):
-            if int(self.tableWidget.item(i, 0).text()) == selectedItem.id:
-                self.tableWidget.removeRow(i)
-                selectedTableItem = self.tableWidget.selectedItems()
-                # If the deleted item is the one currently selected, hide the details pane.
-                if selectedTableItem and selectedTableItem[0].row() == i:
-                    self.detailsWidget.hide()
-                break
-
-        self.parent.items.remove(selectedItem)
+        # If the deleted item is the one currently selected, hide the details pane.
+        if row == selectedRow:
+            self.detailsWidget.hide()
+
+        self.model.beginRemoveRows(QModelIndex(), row, row)
+        self.parent.items.pop(row)
+        self.model.endRemoveRows()
+        self.usedIds.discard(selectedItem.id)
         return selectedItem
 
     def duplicateItem(self):
-        selectedItem = self.tableWidget.selectedItems()
-        if selectedItem:
-            row = selectedItem[0].row()
-            
+        selectedIndexes = self.tableView.selectionModel().selectedIndexes()
+        if selectedIndexes:
+            row = selectedIndexes[0].row()
+
             item = self.getItemByRow(row)
             if item is None:
                 return None
-            
-            dupeItem = deepcopy(item)
-            dupeItem.id = max(it.id for it in self.parent.items) + 1 if self.parent.items else 0
+
+            # A hand-made copy is much lighter than deepcopying the whole Item along with its
+            # results; the duplicate starts without results, just like a newly added Item.
+            dupeItem = Item(
+                name        = item.name,
+                category    = item.category,
+                repetitions = item.repetitions,
+                enabled     = item.enabled,
+                runcode     = item.runcode,
+                validationCmd = replace(item.validationCmd))
+            dupeItem.id = self.maxId + 1
             self.addItem(dupeItem)
 
             return dupeItem
@@ -452,6 +614,12 @@ class SetupWidget(QWidget):
 
     def runAction(self, action: str, actionStack: str | None, *args):
         if action == 'item-add':
+            if len(args) != 0 and type(args[0]) is list:
+                # A whole batch of items: insert them in one go.
+                for item in self.addItemsBatch(args[0]):
+                    if actionStack is not None:
+                        UndoRedo.addAction(actionStack, ('item-remove', item))
+                return
             item = self.addItem(None if len(args) == 0 else args[0])
 
         elif action == 'item-remove':
@@ -459,12 +627,30 @@ class SetupWidget(QWidget):
 
         elif action == 'item-duplicate':
             item = self.duplicateItem()
-            if item is None: 
+            if item is None:
                 # Nothing got duplicated.
                 return
 
+        elif action == 'item-edit':
+            # Replay of a field-level delta coming from the undo/redo stacks.
+            item, fieldName, value = args
+            previousValue = getattr(item, fieldName)
+            setattr(item, fieldName, value)
+            if fieldName == 'id':
+                self.usedIds.discard(previousValue)
+                self.usedIds.add(value)
+                self.maxId = max(self.maxId, value)
+
+            try:
+                row = self.parent.items.index(item)
+            except ValueError:
+                row = None
+            if row is not None:
+                self.model.dataChanged.emit(self.model.index(row, 0), self.model.index(row, 4),
+                    [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.CheckStateRole])
+
         elif action == 'populate-table':
-            with SignalBlocker(self.tableWidget, self.detailsWidget):
+            with SignalBlocker(self.detailsWidget):
                 self.populateTable()
         else:
             print(f'Action "{action}" is not recognizable')
@@ -474,6 +660,10 @@ class SetupWidget(QWidget):
                 UndoRedo.addAction(actionStack, ('item-remove', item))
             elif action == 'item-remove':
                 UndoRedo.addAction(actionStack, ('item-add', item))
+            elif action == 'item-edit':
+                UndoRedo.addAction(actionStack, ('item-edit', item, fieldName, previousValue))
 
     def getItemByRow(self, row: int) -> Optional[Item]:
-        return self.tableWidget.item(row, 0).associatedItem
\ No newline at end of file
+        if 0 <= row < len(self.parent.items):
+            return self.parent.items[row]
+        return None
@@ -15,7 +15,7 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QPushButton, QComboBox, QMessageBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QEvent, QPoint, QRect, QSize, QTimer, pyqtSignal
 
 from widgets.CollapsibleBox import CollapsibleBox
 from widgets.TestContent import TestContent, TestHeader
@@ -23,16 +23,51 @@ from widgets.ContainerWidget import ContainerWidget
 from DataFields import Item, TestResult
 from tools.ParallelExecution import ParallelLoopExecution, ParallelExecution
 from tools.SignalBlocker import SignalBlocker
+from tools.UpdateBlocker import UpdateBlocker
+from tools.Throttler import CallThrottler
 from widgets.LoadingCircle import LoadingCircle
 
 from Icons import createIcon
 
 from typing import List
+from bisect import bisect_left
 from subprocess import CalledProcessError
-from copy import deepcopy
 from datetime import datetime
 
+# Predicates of the fixed category filters. The per-category case is built on the fly in
+# populateTable, once per call, not once per item.
+_categoryFilters = {
+    'All categories' : lambda item: True,
+    'Only OK'        : lambda item: item.testResult == TestResult.OK,
+    'Only ERROR'     : lambda item: item.testResult == TestResult.ERROR,
+}
+
+# Icon resource associated to each test result.
+_iconByResult = {
+    TestResult.OK         : ':test-ok',
+    TestResult.ERROR      : ':test-error',
+    TestResult.UNDEFINED  : ':test-undefined',
+    TestResult.NOT_ALL_OK : ':test-undefined',
+}
+
+class PlaceholderRow(QWidget):
+    # Lightweight stand-in for a CollapsibleBox that is below the viewport. It only carries the
+    # factory to build the real box, which TestWidget swaps in once the row gets scrolled into
+    # view. Building a bare QWidget is orders of magnitude cheaper than a full box.
+
+    def __init__(self, boxFactory, rowHeight: int, parent=None):
+        super().__init__(parent)
+        self.boxFactory = boxFactory
+        self.setFixedHeight(rowHeight)
+
 class TestWidget(QWidget):
+
+    # Emitted for every item that finishes during a test run, and once when the whole run ends.
+    # Workers only emit; the queued connections marshal the updates onto the GUI thread, and the
+    # queue keeps them in order: the run-finished handler always sees every item delivered.
+    testFinished = pyqtSignal(object)
+    runFinished = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__()
 
@@ -40,6 +75,38 @@ class TestWidget(QWidget):
         self.currentTest: List[Item] = []
         self.currentlyRunningTest = False
         self.readOnly = False
+        # The current test only gets reordered when a new test starts, yet populateTable runs on
+        # every filter change: sort once and reuse. The per-filter item lists are cached too and
+        # thrown away whenever the test results change.
+        self.currentTestSorted = False
+        self.filterCache = {}
+        # Boxes of freshly finished tests are buffered and inserted in small batches, so a burst
+        # of short tests doesn't trigger a relayout per test. The items already shown keep a
+        # sorted shadow list, so each box lands at its ordered position no matter in which
+        # order the workers finish.
+        self.pendingTestItems: List[Item] = []
+        self.insertedRunItems: List[Item] = []
+        # Direct references to the loading circles shown while a test runs, so removing them
+        # doesn't need to probe the layouts by index and type.
+        self.topSpinner = None
+        self.scrollSpinner = None
+        self.insertFlushTimer = QTimer(self)
+        self.insertFlushTimer.setSingleShot(True)
+        self.insertFlushTimer.setInterval(33)
+        self.insertFlushTimer.timeout.connect(self.flushPendingInserts)
+
+        self.testFinished.connect(self._onTestItemFinished, Qt.ConnectionType.QueuedConnection)
+        self.runFinished.connect(self._onFinishRun, Qt.ConnectionType.QueuedConnection)
+
+        # Dispatch table for runAction, built once instead of walking an if/elif chain (and
+        # re-creating its closures) on every action.
+        self.actions = {
+            'run-all-tests'   : self._runAllTests,
+            'clear-all-tests' : self._clearAllTests,
+            'rerun-test'      : self._rerunTest,
+            'populate-table'  : self._populate,
+            'set-read-only'   : self._setReadOnly,
+        }
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -76,7 +143,11 @@ class TestWidget(QWidget):
         self.categoryCombo.setFixedHeight(30)
         self.categoryCombo.setMinimumContentsLength(25)
         self.categoryCombo.setEnabled(False)
-        self.categoryCombo.currentTextChanged.connect(lambda: self.populateTable(self.categoryCombo.currentText()))
+        # Scrubbing through the combo fires one signal per intermediate entry; coalesce them
+        # into a single repopulation.
+        self.repopulateThrottled = CallThrottler(
+            lambda: self.populateTable(self.categoryCombo.currentText()), 30)
+        self.categoryCombo.currentTextChanged.connect(self.repopulateThrottled)
 
         self.topBarLayout.addWidget(self.runAllButton)
         self.topBarLayout.addWidget(self.clearAllButton)
@@ -85,15 +156,32 @@ class TestWidget(QWidget):
 
         layout.addWidget(self.topBar)
 
-        scrollArea = QScrollArea(self)
-        scrollArea.setWidgetResizable(True)
-        scrollArea.setAlignment(Qt.AlignmentFlag.AlignTop)
-        layout.addWidget(scrollArea)
+        self.scrollArea = QScrollArea(self)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setAlignment(Qt.AlignmentFlag.AlignTop)
+        layout.addWidget(self.scrollArea)
 
         self.scrollContent = ContainerWidget()
-        scrollArea.setWidget(self.scrollContent)
+        self.scrollArea.setWidget(self.scrollContent)
+
+        # Swap placeholder rows for real boxes as they come into view. Growing the window
+        # reveals rows too, so viewport resizes are watched as well as scrolling; see
+        # eventFilter.
+        self.scrollArea.verticalScrollBar().valueChanged.connect(self.materializeVisibleRows)
+        self.scrollArea.viewport().installEventFilter(self)
+
+        # The boxes live in their own container; the bottom layout only ever holds the running
+        # spinner. This way a finished test is a plain addWidget at the end of the rows instead
+        # of an insert before the spinner.
+        self.scrollBottomLayout = QVBoxLayout(self.scrollContent)
+        self.scrollBottomLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.scrollBottomLayout.setSpacing(0)
+        self.scrollBottomLayout.setContentsMargins(0,0,0,0)
+
+        self.rowsContainer = ContainerWidget()
+        self.scrollBottomLayout.addWidget(self.rowsContainer)
 
-        self.scrollLayout = QVBoxLayout(self.scrollContent)
+        self.scrollLayout = QVBoxLayout(self.rowsContainer)
 
         self.scrollLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.scrollLayout.setSpacing(0)
@@ -103,50 +191,125 @@ class TestWidget(QWidget):
         if not self.currentTest:
             return
 
-        # Remove all items.
-        for i in reversed(range(self.scrollLayout.count())): 
-            self.scrollLayout.itemAt(i).widget().setParent(None)
-        
-        # Add all items in order.
-        self.currentTest.sort()
-        for item in self.currentTest:
-            if not item.enabled:
+        if not self.currentTestSorted:
+            self.currentTest.sort()
+            self.currentTestSorted = True
+            self.filterCache.clear()
+
+        if categoryFilter not in self.filterCache:
+            if categoryFilter is None:
+                pred = lambda item: True
+            else:
+                pred = _categoryFilters.get(categoryFilter) or \
+                       (lambda item, c=categoryFilter: item.category == c)
+            self.filterCache[categoryFilter] = [
+                item for item in self.currentTest if item.enabled and pred(item)]
+
+        # Resolve the rows in plain Python first, so the repaint-suspended region below only
+        # contains the actual widget work.
+        rows = []
+        for item in self.filterCache[categoryFilter]:
+            if self._getIconFromItem(item) is None:
+                print(f"Missing test result for item {item.id} on populateTable")
                 continue
+            # If set as readOnly, pass a dummy container to not show the rerun button.
+            rows.append(lambda item=item: CollapsibleBox(
+                self._getIconFromItem(item), item, self.parent.config,
+                ContainerWidget if self.readOnly else TestHeader,
+                TestContent, self))
+
+        # Suspend repaints so the teardown and repopulation paint once, not once per box.
+        with UpdateBlocker(self.scrollContent):
+            # Remove all items.
+            self._clearScrollLayout()
+
+            # Add all items in order. Only the first row gets a real box built right away (it
+            # sets the height of the placeholders); the rest are stand-ins swapped in while
+            # scrolling.
+            rowHeight = None
+            for boxFactory in rows:
+                if rowHeight is None:
+                    firstBox = boxFactory()
+                    rowHeight = firstBox.sizeHint().height()
+                    self.scrollLayout.addWidget(firstBox)
+                else:
+                    self.scrollLayout.addWidget(PlaceholderRow(boxFactory, rowHeight))
+
+        # Once the layout has settled, build the boxes that landed inside the viewport.
+        QTimer.singleShot(0, self.materializeVisibleRows)
+
+    def eventFilter(self, obj, event):
+        if obj is self.scrollArea.viewport() and event.type() == QEvent.Type.Resize:
+            # Synchronous on purpose: a deferred call could run before the post-populate pass
+            # while the rows still have no geometry, and it would materialize every row.
+            self.materializeVisibleRows()
+        return super().eventFilter(obj, event)
+
+    def materializeVisibleRows(self):
+        # Make sure pending layout work is done, otherwise the rows have no geometry yet and
+        # they would all appear to be inside the viewport. The scroll content may not have grown
+        # to fit the new rows either: give it its full height before measuring.
+        self.scrollLayout.activate()
+        self.scrollBottomLayout.activate()
+        hintHeight = self.scrollContent.sizeHint().height()
+        if self.scrollContent.height() < hintHeight:
+            self.scrollContent.resize(self.scrollContent.width(), hintHeight)
+            self.scrollBottomLayout.activate()
+            self.scrollLayout.activate()
+
+        viewport = self.scrollArea.viewport()
+        viewportRect = viewport.rect()
+
+        for i in range(self.scrollLayout.count()):
+            widget = self.scrollLayout.itemAt(i).widget()
+            if type(widget) is not PlaceholderRow:
+                continue
+
+            rowRect = QRect(widget.mapTo(viewport, QPoint(0, 0)), widget.size())
+            if rowRect.intersects(viewportRect):
+                self.scrollLayout.takeAt(i)
+                self.scrollLayout.insertWidget(i, widget.boxFactory())
+                widget.deleteLater()
 
-            if categoryFilter is None or self._filterItemByCategory(item, categoryFilter):
+    def flushPendingInserts(self):
+        # Insert all the buffered boxes in one repaint, just above the bottom loading circle.
+        if not self.pendingTestItems:
+            return
+        items, self.pendingTestItems = self.pendingTestItems, []
+
+        with UpdateBlocker(self.scrollContent):
+            for item in items:
                 icon = self._getIconFromItem(item)
                 if icon is None:
-                    print(f"Missing test result for item {item.id} on populateTable")
+                    print(f"Missing test result for item {item.id} on flushPendingInserts")
                     continue
-                # If set as readOnly, pass a dummy container to not show the rerun button.
-                self.scrollLayout.addWidget(
-                    CollapsibleBox(icon, item, self.parent.config, 
-                                   ContainerWidget if self.readOnly else TestHeader, 
-                                   TestContent, self))
+
+                # Workers (and verdict-cache hits) finish in any order: place the box at the
+                # item's sorted position so the list reads like the sequential run did.
+                index = bisect_left(self.insertedRunItems, item)
+                self.insertedRunItems.insert(index, item)
+                self.scrollLayout.insertWidget(
+                    index,
+                    CollapsibleBox(icon, item, self.parent.config, TestHeader, TestContent, self))
+                # Add the category to the combo if its not already inside.
+                self.addCategoryToCombo(item.category)
+
+        # One aggregated message per flush instead of one per finished test.
+        self.parent.statusBar.showMessage(
+            f"Item {items[0].id} successfully run." if len(items) == 1
+            else f"Ran {len(items)} tests.", 3000)
+
+    def _clearScrollLayout(self):
+        # takeAt detaches each entry from the layout without the synchronous reparent (style
+        # unpolish plus geometry recompute) that setParent(None) forces per widget; the actual
+        # destruction is deferred to the event loop in one pass.
+        while (layoutItem := self.scrollLayout.takeAt(0)) is not None:
+            widget = layoutItem.widget()
+            if widget is not None:
+                widget.deleteLater()
 
     def _getIconFromItem(self, item: Item) -> str:
-        match item.testResult:
-            case TestResult.OK:
-                return ':test-ok'
-            case TestResult.ERROR:
-                return ':test-error'
-            case TestResult.UNDEFINED:
-                return ':test-undefined'
-            case TestResult.NOT_ALL_OK:
-                return ':test-undefined'
-            case _:
-                return None
-
-    def _filterItemByCategory(self, item: Item, categoryFilter: str) -> bool:
-        match categoryFilter:
-            case 'All categories':
-                return True
-            case 'Only OK':
-                return item.testResult == TestResult.OK
-            case 'Only ERROR':
-                return item.testResult == TestResult.ERROR
-            case _:
-                return item.category == categoryFilter
+        return _iconByResult.get(item.testResult)
 
     def runAction(self, action, actionStack, *args):
         if self.currentlyRunningTest:
@@ -155,216 +318,285 @@ class TestWidget(QWidget):
                     'Please, wait till the testing has ended.')
             return
 
+        actionHandler = self.actions.get(action)
+        if actionHandler is None:
+            print(f'Action "{action}" is not recognizable')
+            return
+
         self.currentlyRunningTest = True
+        actionHandler(actionStack, *args)
+
+    def _onException(self, e: Exception):
+        detailMessage = "Details:\n"
+        if type(e) is CalledProcessError:
+            detailMessage += "Command arguments: "
+            for arg in e.cmd:
+                detailMessage += str(arg) + " "
+            detailMessage += f'\nReturn code: {e.returncode}\nError output: {e.stderr.decode("utf-8")}'
+        else:
+            detailMessage += str(e)
+
+        QMessageBox.critical(self, 'Fatal error while running test', 
+                f'A fatal error occurred. {detailMessage}')
+
+        self._onFinishRun()
+
+    def _onFinishRun(self):
+        # Drain whatever boxes are still waiting before the loading circles go away.
+        self.insertFlushTimer.stop()
+        self.flushPendingInserts()
+
+        # The run filled in the test results, so the cached filter lists are stale.
+        self.filterCache.clear()
+        self.topBar.setEnabled(True)
+        self.parent.setEnableToolbars(True)
+        with SignalBlocker(self.categoryCombo):
+            self.categoryCombo.setEnabled(True)
+            self.categoryCombo.setPlaceholderText("Categories")
+            self.categoryCombo.setCurrentIndex(0)
+        self.currentlyRunningTest = False
 
-        def onException(e: Exception):
-            detailMessage = "Details:\n"
-            if type(e) is CalledProcessError:
-                detailMessage += "Command arguments: "
-                for arg in e.cmd:
-                    detailMessage += str(arg) + " "
-                detailMessage += f'\nReturn code: {e.returncode}\nError output: {e.stderr.decode("utf-8")}'
-            else:
-                detailMessage += str(e)
-                
-            QMessageBox.critical(self, 'Fatal error while running test', 
-                    f'A fatal error occurred. {detailMessage}')
-            
-            onFinishRun()
-
-        def onFinishRun():
-            self.topBar.setEnabled(True)
-            self.parent.setEnableToolbars(True)
-            with SignalBlocker(self.categoryCombo):
-                self.categoryCombo.setEnabled(True)
-                self.categoryCombo.setPlaceholderText("Categories")
-                self.categoryCombo.setCurrentIndex(0)
-            self.currentlyRunningTest = False
-            
-            # Remove the loading circle from the scroll window.
-            widgAtBottomOfScroll = self.scrollLayout.itemAt(self.scrollLayout.count()-1).widget()
-            if type(widgAtBottomOfScroll) is LoadingCircle:
-                widgAtBottomOfScroll.setParent(None)
-
-            # Remove the LoadingCircle from the upper button bar.
-            widgAtTopBar = self.topBarLayout.itemAt(2).widget()
-            if type(widgAtTopBar) is LoadingCircle:
-                widgAtTopBar.setParent(None)
-
-        def updateFieldsAfterRun(args):
-            item: Item = args
-
-            icon = self._getIconFromItem(item)
-            if icon is None:
-                print(f"Missing test result for item {item.id} on UpdateFieldsAfterRun")
-                return
-            
-            self.scrollLayout.insertWidget(self.scrollLayout.count()-1, 
-                                            CollapsibleBox(icon, item, self.parent.config, TestHeader, TestContent, self))
-            self.parent.statusBar.showMessage(f"Item {item.id} successfully run.", 3000)
-            # Add the category to the combo if its not already inside.
-            if self.categoryCombo.findText(item.category) == -1:
-                self.categoryCombo.addItem(item.category)
-
-        if action == 'run-all-tests':
-            if self.readOnly:
-                self.currentlyRunningTest = False
-                return
-    
-            if self.currentTest:
-                reply = QMessageBox.question(self, 'Clear all tests for new test?',
-                                            'You are about to begin a new test.\n' 
-                                            'For that, you will need to clear the current test results.\n'
-                                            'Are you sure you want to CLEAR ALL results for a new test?',
-                                            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                            QMessageBox.StandardButton.Yes)
-                if reply == QMessageBox.StandardButton.No:
-                    self.currentlyRunningTest = False
-                    return
-                elif reply == QMessageBox.StandardButton.Yes:
-                    # This is so it can enter the clear-all function.
-                    self.currentlyRunningTest = False
-                    self.runAction('clear-all-tests', None, False)
-                    self.currentlyRunningTest = True
-                else:
-                    self.currentlyRunningTest = False
-                    return
-            
-            self.currentTest = deepcopy(self.parent.items)
-            funcArg = [it for it in self.currentTest if it.enabled]
-
-            if funcArg:
-                self.parent.statusBar.showMessage(f"Started running {len(funcArg)} tests.", 3000)
+        # Remove the loading circles from the scroll window and the upper button bar.
+        if self.scrollSpinner is not None:
+            self.scrollSpinner.setParent(None)
+            self.scrollSpinner = None
+        if self.topSpinner is not None:
+            self.topSpinner.setParent(None)
+            self.topSpinner = None
+
+    def _onTestItemFinished(self, item: Item):
+        self.parent.testResultCache.store(item)
+        self.pendingTestItems.append(item)
+        self.insertFlushTimer.start()
+
+    def _confirm(self, title, text, onYes):
+        # question() would nest a modal event loop on the GUI thread, servicing queued signals
+        # from a still-settling run inside the dialog. open() shows the dialog without nesting:
+        # the action continues in the finished slot on a real user click, or is cancelled by
+        # releasing the busy flag.
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        box.setDefaultButton(QMessageBox.StandardButton.Yes)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def onFinished(result):
+            if result == QMessageBox.StandardButton.Yes:
+                onYes()
             else:
-                self.parent.statusBar.showMessage("Nothing to run.", 3000)
                 self.currentlyRunningTest = False
-                return
 
-            self.parent.projectDataFields.date = datetime.now().strftime("%d/%m/%Y %H:%M:%S.%f")
-            self.parent.projectDataFields.testCount = len(funcArg)
+        box.finished.connect(onFinished)
+        box.open()
 
-            # Add loading circle to the right of the two top buttons.
-            loadcircle = LoadingCircle(20,20)
-            loadcircle.setAlignment(Qt.AlignmentFlag.AlignLeft)
-            self.topBarLayout.insertWidget(2, loadcircle)
+    def _runAllTests(self, actionStack, *args):
+        if self.readOnly:
+            self.currentlyRunningTest = False
+            return
 
-            self.topBar.setEnabled(False)
-            self.parent.setEnableToolbars(False)
-            with SignalBlocker(self.categoryCombo):
-                self.clearCategoryCombo()
-                self.categoryCombo.setPlaceholderText("Running...")
-                self.categoryCombo.setEnabled(False)
+        if self.currentTest:
+            self._confirm('Clear all tests for new test?',
+                          'You are about to begin a new test.\n'
+                          'For that, you will need to clear the current test results.\n'
+                          'Are you sure you want to CLEAR ALL results for a new test?',
+                          self._startConfirmedRunAll)
+            return
 
-            self.scrollLayout.addWidget(LoadingCircle(60,60))
+        self._startConfirmedRunAll()
 
-            self.pex = ParallelLoopExecution(funcArg, lambda args: args.test(), updateFieldsAfterRun, onFinishRun, onException)
-            self.pex.run()
+    def _startConfirmedRunAll(self):
+        if self.currentTest:
+            # This is so it can enter the clear-all function.
+            self.currentlyRunningTest = False
+            self.runAction('clear-all-tests', None, False)
+            self.currentlyRunningTest = True
+
+        # The enabled count can be checked on the original list: the expensive copy of the
+        # items is only worth starting if there is something to run.
+        enabledCount = sum(1 for it in self.parent.items if it.enabled)
+        if enabledCount == 0:
+            self.parent.statusBar.showMessage("Nothing to run.", 3000)
+            self.currentlyRunningTest = False
+            return
 
-        elif action == 'clear-all-tests':
-            if self.readOnly:
-                self.currentlyRunningTest = False
-                return
-            
-            if len(args) > 0 and args[0]:
-                reply = QMessageBox.question(self, 'Clear all tests?',
-                                            'You will clear all test results.\nAre you sure about it?',
-                                            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                            QMessageBox.StandardButton.Yes)
-                if reply == QMessageBox.StandardButton.No:
-                    self.currentlyRunningTest = False
-                    return
-            
-            # Remove all items.
-            for i in reversed(range(self.scrollLayout.count())): 
-                self.scrollLayout.itemAt(i).widget().setParent(None)
-            
-            if self.currentTest:
-                self.currentTest.clear()
+        self.parent.statusBar.showMessage(f"Started running {enabledCount} tests.", 3000)
 
-            self.categoryCombo.setCurrentIndex(-1)
+        self.parent.projectDataFields.date = datetime.now().strftime("%d/%m/%Y %H:%M:%S.%f")
+        self.parent.projectDataFields.testCount = enabledCount
+
+        self.currentTestSorted = False
+        self.filterCache.clear()
+        # The rows were just cleared: start the sorted shadow list of inserted boxes afresh.
+        self.insertedRunItems = []
+
+        # Add loading circle to the right of the two top buttons.
+        self.topSpinner = LoadingCircle(20,20)
+        self.topSpinner.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.topBarLayout.insertWidget(2, self.topSpinner)
+
+        self.topBar.setEnabled(False)
+        self.parent.setEnableToolbars(False)
+        with SignalBlocker(self.categoryCombo):
+            self.clearCategoryCombo()
+            self.categoryCombo.setPlaceholderText("Running...")
             self.categoryCombo.setEnabled(False)
 
+        self.scrollSpinner = LoadingCircle(60,60)
+        self.scrollBottomLayout.addWidget(self.scrollSpinner)
+
+        # Copying the items can take long on big projects: do it on a worker thread so the
+        # loading circle shows up right away, then chain into the test loop.
+        self.copyPex = ParallelExecution(self._copyCurrentItems, self._startTestsAfterCopy,
+                                         self._onException)
+        self.copyPex.run()
+
+    def _copyCurrentItems(self):
+        # Direct clone calls: no per-element dispatch through the copy module.
+        self.currentTest = [it.cloneForTest() for it in self.parent.items]
+
+    def _startTestsAfterCopy(self):
+        # Items that already carry a full OK test (e.g. from an imported test) would trivially
+        # pass again: keep their prior outputs and skip the worker round-trip. Stale results are
+        # not a concern here, editing an item's command or repetitions already clears them.
+        candidates = [it for it in self.currentTest
+                      if it.enabled and not (it.testResult == TestResult.OK and it.hasBeenTested())]
+
+        # Answer from the verdict cache whatever hasn't changed since its last run. The digest
+        # covers the command, repetitions, validation and expected outputs, so a hit is the
+        # verdict this exact test would produce again.
+        cache = self.parent.testResultCache
+        funcArg = []
+        for it in candidates:
+            if cache.apply(it):
+                self.testFinished.emit(it)
+            else:
+                funcArg.append(it)
+
+        if not funcArg:
+            # Everything was answered without running; close the run so the results get shown.
+            self.runFinished.emit()
+            return
+        self.pex = ParallelLoopExecution(funcArg, lambda args: args.test(),
+                                         self.testFinished.emit, self.runFinished.emit,
+                                         self._onException)
+        self.pex.run()
+
+    def _clearAllTests(self, actionStack, *args):
+        if self.readOnly:
             self.currentlyRunningTest = False
+            return
 
-        elif action == 'rerun-test':
-            if self.readOnly:
-                self.currentlyRunningTest = False
-                return
+        if len(args) > 0 and args[0]:
+            self._confirm('Clear all tests?',
+                          'You will clear all test results.\nAre you sure about it?',
+                          self._doClearAllTests)
+            return
 
-            # This item belongs to the self.currentTest (from the deep copy).
-            rerunBox: CollapsibleBox = args[0]
-            rerunItem: Item = rerunBox.item
+        self._doClearAllTests()
 
-            # This item will be set as rerun.
-            rerunItem.wasTestRepeated += 1
+    def _doClearAllTests(self):
+        # Remove all items.
+        with UpdateBlocker(self.scrollContent):
+            self._clearScrollLayout()
 
-            # Disable the box.
-            rerunBox.setEnabled(False)
+        if self.currentTest:
+            self.currentTest.clear()
+        self.currentTestSorted = False
+        self.filterCache.clear()
 
-            # Clear the test results.
-            rerunItem.clearTest()
+        self.categoryCombo.setCurrentIndex(-1)
+        self.categoryCombo.setEnabled(False)
 
-            self.topBar.setEnabled(False)
-            self.parent.setEnableToolbars(False)
-            with SignalBlocker(self.categoryCombo):
-                self.categoryCombo.setPlaceholderText("Running...")
-                self.categoryCombo.setCurrentIndex(-1)
-                self.categoryCombo.setEnabled(False)
+        self.currentlyRunningTest = False
 
-            def updateBoxAfterRun():
-                item: Item = rerunBox.item
-                boxWasOpened = rerunBox.content.isVisible()
+    def _rerunTest(self, actionStack, *args):
+        if self.readOnly:
+            self.currentlyRunningTest = False
+            return
 
-                icon = self._getIconFromItem(item)
-                if icon is None:
-                    print(f"Missing test result for item {item.id} on updateBoxAfterRun")
-                    return
-                
-                positionOfOldBox = self.scrollLayout.indexOf(rerunBox)
-                oldBox = self.scrollLayout.takeAt(positionOfOldBox).widget()
-                oldBox.deleteLater()
-
-                newBox = CollapsibleBox(icon, item, self.parent.config, TestHeader, TestContent, self)
-                if boxWasOpened:
-                    newBox.toggleContent(None)
-
-                self.scrollLayout.insertWidget(positionOfOldBox, newBox)
-                self.parent.statusBar.showMessage(f"Item {item.id} successfully run.", 3000)
-                
-                # Add the category to the combo if its not already inside.
-                if self.categoryCombo.findText(item.category) == -1:
-                    self.categoryCombo.addItem(item.category)
-                
-                # Reenable all the GUI elements.
-                onFinishRun()
+        # This item belongs to the self.currentTest (from the deep copy).
+        rerunBox: CollapsibleBox = args[0]
+        rerunItem: Item = rerunBox.item
 
-            self.pex = ParallelExecution(lambda: rerunItem.test(), updateBoxAfterRun, onException)
-            self.pex.run()
+        # This item will be set as rerun.
+        rerunItem.wasTestRepeated += 1
 
-        elif action == 'populate-table':
-            self.currentlyRunningTest = False
-            self.populateTable(args[0])
+        # Disable the box.
+        rerunBox.setEnabled(False)
 
-        elif action == 'set-read-only':
-            self.currentlyRunningTest = False
-            self.readOnly = args[0]
-            self.runAllButton.setDisabled(args[0])
-            self.clearAllButton.setDisabled(args[0])
-            if args[0]:
-                with SignalBlocker(self.categoryCombo):
-                    self.categoryCombo.setEnabled(True)
-                    self.categoryCombo.setCurrentIndex(0)
-                    for it in self.currentTest:
-                        if self.categoryCombo.findText(it.category) == -1:
-                            self.categoryCombo.addItem(it.category)
-            else:
-                with SignalBlocker(self.categoryCombo):
-                    self.clearCategoryCombo()
-                    self.categoryCombo.setEnabled(False)
+        # Clear the test results.
+        rerunItem.clearTest()
+
+        self.topBar.setEnabled(False)
+        self.parent.setEnableToolbars(False)
+        with SignalBlocker(self.categoryCombo):
+            self.categoryCombo.setPlaceholderText("Running...")
+            self.categoryCombo.setCurrentIndex(-1)
+            self.categoryCombo.setEnabled(False)
+
+        self.pex = ParallelExecution(lambda: rerunItem.test(),
+                                     lambda: self._updateBoxAfterRun(rerunBox),
+                                     self._onException)
+        self.pex.run()
+
+    def _updateBoxAfterRun(self, rerunBox):
+        item: Item = rerunBox.item
+
+        icon = self._getIconFromItem(item)
+        if icon is None:
+            print(f"Missing test result for item {item.id} on _updateBoxAfterRun")
+            return
+
+        # The box is refreshed in place: no widget teardown, no layout insertion.
+        rerunBox.refresh(icon)
+        rerunBox.setEnabled(True)
+        self.parent.statusBar.showMessage(f"Item {item.id} successfully run.", 3000)
+
+        # Add the category to the combo if its not already inside.
+        self.addCategoryToCombo(item.category)
+
+        # Reenable all the GUI elements.
+        self._onFinishRun()
+
+    def _populate(self, actionStack, *args):
+        self.currentlyRunningTest = False
+        # The current test may have just been swapped (e.g. on file load).
+        self.currentTestSorted = False
+        self.filterCache.clear()
+        self.populateTable(args[0])
+
+    def _setReadOnly(self, actionStack, *args):
+        self.currentlyRunningTest = False
+        self.readOnly = args[0]
+        self.runAllButton.setDisabled(args[0])
+        self.clearAllButton.setDisabled(args[0])
+        if args[0]:
+            with SignalBlocker(self.categoryCombo):
+                self.categoryCombo.setEnabled(True)
+                self.categoryCombo.setCurrentIndex(0)
+                # One bulk insert instead of one combo update per item.
+                newCategories = [it.category for it in self.currentTest
+                                 if it.category not in self.categoriesSeen]
+                self.categoriesSeen.update(newCategories)
+                self.categoryCombo.addItems(list(dict.fromkeys(newCategories)))
+        else:
+            with SignalBlocker(self.categoryCombo):
+                self.clearCategoryCombo()
+                self.categoryCombo.setEnabled(False)
 
     def clearCategoryCombo(self):
         self.categoryCombo.clear()
         self.categoryCombo.setCurrentIndex(-1)
         self.categoryCombo.addItem('All categories')
         self.categoryCombo.addItem('Only OK')
-        self.categoryCombo.addItem('Only ERROR')
\ No newline at end of file
+        self.categoryCombo.addItem('Only ERROR')
+        # Mirror of the combo entries: findText is a linear scan over the combo for every
+        # finished test, a set lookup is not.
+        self.categoriesSeen = {'All categories', 'Only OK', 'Only ERROR'}
+
+    def addCategoryToCombo(self, category: str):
+        if category not in self.categoriesSeen:
+            self.categoriesSeen.add(category)
+            self.categoryCombo.addItem(category)
\ No newline at end of file
@@ -1,8 +1,8 @@
 # **************************************************************************************************
 # @file ParallelExecution.py
-# @brief All GUI changes must be done on the core that's running PyQt. For time expensive processes, 
-# it may freeze the screen, which is not good. This class aids by moving the process to another 
-# thread while leaving free the main core. 
+# @brief All GUI changes must be done on the core that's running PyQt. For time expensive processes,
+# it may freeze the screen, which is not good. This class aids by moving the process to another
+# thread while leaving free the main core.
 #
 # @project   VVToolkit
 # @version   1.0
@@ -13,133 +13,129 @@
 # This project is licensed under the MIT License - see the LICENSE file for details.
 # **************************************************************************************************
 
-from PyQt6.QtCore import pyqtSignal, QObject, pyqtSlot, QThread
+from PyQt6.QtCore import pyqtSignal, QObject, pyqtSlot, QRunnable, QThreadPool
+from functools import partial
 
 class Worker(QObject):
 
     exceptionSignal = pyqtSignal(Exception)
-    finishedSignal = pyqtSignal()
-    
-    def __init__(self, runFunction, parent: QObject | None = None) -> None:
+    # Carries the payload handed to the constructor, so a loop can tell which of its concurrent
+    # tasks finished. Plain ParallelExecution passes no payload and ignores the argument.
+    finishedSignal = pyqtSignal(object)
+
+    def __init__(self, runFunction, payload = None, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self.runFunction = runFunction
+        self.payload = payload
 
-    @pyqtSlot()
     def run(self):
         try:
             # Run the function.
             self.runFunction()
             # Signal that the task is finished
-            self.finishedSignal.emit()
+            self.finishedSignal.emit(self.payload)
         except Exception as e:
             # If an error happens, it will call the errorSignal.
             self.exceptionSignal.emit(e)
             return
-        
 
-class ParallelExecution():
+class WorkerRunnable(QRunnable):
+    # Thin adapter so a Worker can be handed to the thread pool. The pool reuses its threads, so
+    # starting a task doesn't pay for creating (and later destroying) a whole QThread.
+
+    def __init__(self, worker: Worker) -> None:
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run()
+
+class ParallelExecution(QObject):
+    # The class is a QObject living on the GUI thread: the worker emits its signals from a pool
+    # thread, so the connections below are queued and the callbacks always run on the GUI thread.
+
     def __init__(self, runFunction, onFinishFunction, onException = None) -> None:
+        super().__init__()
         self.runFunction = runFunction
         self.onFinishFunction = onFinishFunction
         self.onException = onException
         self.exceptionOccurred = False
 
-        self.thread = QThread()
         self.worker = Worker(self.runFunction)
-        self.worker.moveToThread(self.thread)
-        
-        # Connect the signals
-        self.worker.finishedSignal.connect(self.thread.quit)
-        self.worker.finishedSignal.connect(self.worker.deleteLater)
 
-        self.worker.exceptionSignal.connect(self.thread.quit)
-        self.worker.exceptionSignal.connect(self.worker.deleteLater)
-
-        self.thread.finished.connect(self.thread.deleteLater)
+        # Connect the signals
+        self.worker.finishedSignal.connect(self.finishFunction)
+        self.worker.exceptionSignal.connect(self.exceptionFunction)
 
-        if self.onFinishFunction is not None:
-            self.thread.finished.connect(self.finishFunction)
-        if self.onException is not None:
-            self.worker.exceptionSignal.connect(self.exceptionFunction)
-        
-        # Connect the start of thread to the run function of the worker.
-        self.thread.started.connect(self.worker.run)
-
-    pyqtSlot()
-    def finishFunction(self):
-        if not self.exceptionOccurred:
+    @pyqtSlot(object)
+    def finishFunction(self, payload):
+        if not self.exceptionOccurred and self.onFinishFunction is not None:
             self.onFinishFunction()
 
-    pyqtSlot(Exception)
+    @pyqtSlot(Exception)
     def exceptionFunction(self, e: Exception):
         self.exceptionOccurred = True
-        self.onException(e)
+        if self.onException is not None:
+            self.onException(e)
 
     def run(self):
-        # Start the thread.
-        self.thread.start()
+        # Hand the task to the shared pool.
+        QThreadPool.globalInstance().start(WorkerRunnable(self.worker))
+
+class ParallelLoopExecution(QObject):
+    # Submits every item to the pool at once, so independent items run concurrently on up to
+    # idealThreadCount() threads instead of one after the other. The per-item and end-of-loop
+    # callbacks still run on the GUI thread (see ParallelExecution), in whichever order the
+    # items finish.
 
-class ParallelLoopExecution():
     def __init__(self, loopItems, runFunction, onFinishFunction, onLoopFinished, onException = None) -> None:
+        super().__init__()
         self.loopItems = loopItems
         self.runFunction = runFunction
         self.onFinishFunction = onFinishFunction
         self.onLoopFinished = onLoopFinished
         self.onException = onException
         self.exceptionOccurred = False
+        # Number of submitted items that haven't finished yet. Only touched from the GUI thread
+        # (the queued slots below), so no locking is needed.
+        self.outstanding = 0
+        self.workers = []
 
+    @pyqtSlot(object)
     def finishedFunction(self, item):
-        # This function gets called when the exception calls for the loop to be exited. This if 
-        # statement keeps the next item to be processed.
-        if not self.exceptionOccurred:
+        # After an exception the remaining in-flight items still finish, but their callbacks are
+        # dropped: the loop already halted through exceptionFunction.
+        if self.exceptionOccurred:
+            return
+
+        if self.onFinishFunction is not None:
             self.onFinishFunction(item)
-            # When the thread finishes, call for the next item.
-            self.run()
 
-    pyqtSlot(Exception)
+        self.outstanding -= 1
+        if self.outstanding == 0:
+            self.onLoopFinished()
+
+    @pyqtSlot(Exception)
     def exceptionFunction(self, e: Exception):
+        if self.exceptionOccurred:
+            return
         self.exceptionOccurred = True
-        self.onException(e)
+        if self.onException is not None:
+            self.onException(e)
 
     def run(self):
-        self._runItem(self._getNextItem())
-
-    def _getNextItem(self):
-        if self.loopItems:
-            return self.loopItems.pop(0)
-        return None
-
-    def _runItem(self, item):
-        if item is None:
+        items = list(self.loopItems)
+        self.outstanding = len(items)
+        if self.outstanding == 0:
             self.onLoopFinished()
             return
 
-        self.thread = QThread()
-        self.worker = Worker(lambda: self.runFunction(item))
-        self.worker.moveToThread(self.thread)
-        
-        # Connect the signals
-        self.worker.finishedSignal.connect(self.thread.quit)
-        self.worker.finishedSignal.connect(self.worker.deleteLater)
-
-        self.worker.exceptionSignal.connect(self.thread.quit)
-        self.worker.exceptionSignal.connect(self.worker.deleteLater)
-        
-        self.thread.finished.connect(self.thread.deleteLater)
-        if self.onFinishFunction is not None:
-            # If all went OK, run the finish function when the thread is closed. That way the thread
-            # won't be destroyed whilst running. This function passes to the next item in the list.
-            # If it were to continue running on the next item whilst the other thread was running 
-            # it would raise an exception because it would be deleted without it being stopped.
-            self.thread.finished.connect(lambda: self.finishedFunction(item))
-
-        if self.onException is not None:
-            # On exception the whole loop halts. In this case, the thread will get closed 
-            # automatically and it doesn't have the problem as before as there won't be any more 
-            # items being processed.
-            self.worker.exceptionSignal.connect(self.exceptionFunction)
-        
-        # Connect the start of thread to the run function of the worker.
-        self.thread.started.connect(self.worker.run)
-        # Start the thread.
-        self.thread.start()
\ No newline at end of file
+        for item in items:
+            # partial is a C-level callable with the argument bound directly: no closure cell
+            # per item and no extra Python frame when the worker invokes it.
+            worker = Worker(partial(self.runFunction, item), item)
+            worker.finishedSignal.connect(self.finishedFunction)
+            worker.exceptionSignal.connect(self.exceptionFunction)
+            # Keep a reference so the workers outlive this method while the pool runs them.
+            self.workers.append(worker)
+            QThreadPool.globalInstance().start(WorkerRunnable(worker))
@@ -11,15 +11,21 @@
 # This project is licensed under the MIT License - see the LICENSE file for details.
 # **************************************************************************************************
 
+from PyQt6.QtCore import QSignalBlocker
+
 class SignalBlocker:
+    # Thin context manager over Qt's own QSignalBlocker: each one blocks its widget natively on
+    # construction and restores the previous blocked state on destruction, so nested blocks on
+    # the same widget unwind correctly.
+
     def __init__(self, *widgets):
         self.widgets = widgets
+        self.blockers = []
 
     def __enter__(self):
-        for widget in self.widgets:
-            widget.blockSignals(True)
+        self.blockers = [QSignalBlocker(widget) for widget in self.widgets]
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        for widget in self.widgets:
-            widget.blockSignals(False)
+        # Dropping the references runs each QSignalBlocker destructor, unblocking the signals.
+        self.blockers.clear()
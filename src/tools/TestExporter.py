@@ -11,16 +11,14 @@
 # This project is licensed under the MIT License - see the LICENSE file for details.
 # **************************************************************************************************
 
-import os
-import shutil
 import re
-import zipfile
-import xml.etree.ElementTree as ET
+from copy import copy
+from functools import lru_cache
 
 import openpyxl
 import openpyxl.cell
 import openpyxl.worksheet
-from openpyxl.styles import PatternFill, Border, Alignment, Protection, Font
+from openpyxl.workbook.defined_name import DefinedName
 
 from DataFields import Item, TestDataFields, TestResult
 
@@ -32,7 +30,10 @@ from io import BytesIO
 # Don't remove this "unused" import, contains the resource images.
 import ResourcePacket
 
-def replacePlaceholders(filePath: str, testFields: TestDataFields, items: List[Item]):
+# The embedded model never changes, so the QFile read and QByteArray decode happen once; every
+# export reuses the same bytes object.
+@lru_cache(maxsize=1)
+def _readModelBytes() -> bytes:
     # Load the Excel file from ResourcePacket.
     qfile = QFile(':excel-model')
     if not qfile.open(QIODevice.OpenModeFlag.ReadOnly):
@@ -40,54 +41,63 @@ def replacePlaceholders(filePath: str, testFields: TestDataFields, items: List[I
 
     excelData = qfile.readAll()
     qfile.close()
+    return excelData.data()
 
-    # Duplicate the model into filePath.
-    with open(filePath, 'wb') as f:
-        f.write(excelData)
+# The model is static, so its geometry (anchor rows, block ranges) and the snapshotted template
+# blocks are parsed once per program run; each export only parses its own destination workbook.
+@lru_cache(maxsize=1)
+def _loadModel() -> dict:
+    modelSheet = openpyxl.load_workbook(BytesIO(_readModelBytes()))["VFR"]
 
-    # Convert to a BytesIO object
-    excelFileStream = BytesIO(excelData.data())
+    anchors = _indexAnchors(modelSheet, {"VFR data block:", "Test block:", "Iteration block:",
+                                         "Delete area:", "COMMENCE TESTS"})
 
-    modelWorkbook = openpyxl.load_workbook(excelFileStream)
-    # Select the worksheet.
-    modelSheet = modelWorkbook["VFR"]
-    
-    # This does not work! And I really need it :(
-    # modelSheet.print_area = "A:B"
-    # Not even this works!
-    # modelSheet.print_area = "A1:B2"
+    # The cell to the right of each anchor holds the range of its block.
+    def rangeOfAnchor(anchorName):
+        anchor = anchors[anchorName]
+        return modelSheet.cell(row=anchor.row, column=anchor.column+1).value
+
+    vfrBlock = modelSheet[rangeOfAnchor("VFR data block:")]
 
-    # As I cannot set the columns as the print area, I'll set a random range inside the excel file.
-    # This will create the field inside the workbook.xml file contained in the .xlsx (an .xlsx is 
-    # basically a .zip file) and then I'll substitute it with "$A:$B" which is what i want. 
+    return {
+        'vfrRows'        : (vfrBlock[0][0].row, vfrBlock[0][0].row + len(vfrBlock)),
+        'testBlock'      : _snapshotBlock(modelSheet[rangeOfAnchor("Test block:")]),
+        'iterationBlock' : _snapshotBlock(modelSheet[rangeOfAnchor("Iteration block:")]),
+        'deleteAreaRange': rangeOfAnchor("Delete area:"),
+        'commenceRow'    : anchors["COMMENCE TESTS"].row + 1,
+    }
 
-    destinyWorkbook = openpyxl.load_workbook(filePath)
+def replacePlaceholders(filePath: str, testFields: TestDataFields, items: List[Item]):
+    model = _loadModel()
+
+    destinyWorkbook = openpyxl.load_workbook(BytesIO(_readModelBytes()))
     destinySheet = destinyWorkbook["VFR"]
 
+    # print_area cannot express a whole-column range ("A:B" fails CellRange validation), but the
+    # sheet-local defined name underneath it can: drop the model's bounded area and write the
+    # column range directly, so the workbook comes out of save() with the right print area and
+    # no zip surgery afterwards.
+    destinySheet.print_area = None
+    destinySheet.defined_names['_xlnm.Print_Area'] = DefinedName('_xlnm.Print_Area',
+                                                                 attr_text="VFR!$A:$B")
+
     # Edit the VFR data block and fill it with the testFields fields.
-    vfrBlockRange = _findCellByContent(modelSheet, "VFR data block:")
-    vfrBlockRange = modelSheet.cell(row=vfrBlockRange.row, column=vfrBlockRange.column+1).value
-    vfrBlock      = modelSheet[vfrBlockRange]
-    rowStart      = vfrBlock[0][0].row
-    _substituteExcelVariable(destinySheet, rowStart, rowStart+len(vfrBlock), {"testFields": testFields})
-
-    # Fetch the "test" header and the "iteration" block from the model.
-    testBlockRange = _findCellByContent(modelSheet, "Test block:")
-    testBlockRange = modelSheet.cell(row=testBlockRange.row, column=testBlockRange.column+1).value
-    iterationBlockRange = _findCellByContent(modelSheet, "Iteration block:")
-    iterationBlockRange = modelSheet.cell(row=iterationBlockRange.row, column=iterationBlockRange.column+1).value
-    
-    testBlock       = modelSheet[testBlockRange]
-    iterationBlock  = modelSheet[iterationBlockRange]
+    rowStart, rowEnd = model['vfrRows']
+    _substituteExcelVariable(destinySheet, rowStart, rowEnd, {"testFields": testFields})
+
+    # The "test" header and the "iteration" block come pre-snapshotted from the cached model:
+    # the paste region overlaps their rows, so they cannot be read live from this sheet.
+    testBlock       = model['testBlock']
+    iterationBlock  = model['iterationBlock']
 
     exportItems = [it for it in items if it.enabled]
     totalTestCount = len(exportItems)
 
-    rowStart = _findCellByContent(modelSheet, "COMMENCE TESTS").row + 1
+    rowStart = model['commenceRow']
 
     for itemNumber, item in enumerate(exportItems):
         # Copy the test block.
-        _copyRangeToStartingCell(destinySheet, testBlock, modelSheet.cell(row=rowStart, column=1))
+        _pasteBlock(destinySheet, testBlock, rowStart)
 
         # Edit the newly pasted fields.
         envVars = {
@@ -104,7 +114,7 @@ def replacePlaceholders(filePath: str, testFields: TestDataFields, items: List[I
 
         for iterationNumber, iteration in enumerate(item.testOutput):
             # Copy the iteration block.
-            _copyRangeToStartingCell(destinySheet, iterationBlock, destinySheet.cell(row=rowStart, column=1))
+            _pasteBlock(destinySheet, iterationBlock, rowStart)
 
             # Edit the newly pasted fields. 
             newEnvVars = {
@@ -117,160 +127,81 @@ def replacePlaceholders(filePath: str, testFields: TestDataFields, items: List[I
             rowStart += len(iterationBlock)
     
     # Clear the "Delete Area" (where the cell range indicators are).
-    deleteAreaRange = _findCellByContent(destinySheet, "Delete area:")
-    deleteAreaRange = destinySheet.cell(row=deleteAreaRange.row, column=deleteAreaRange.column+1).value
-    deleteBlock     = destinySheet[deleteAreaRange]
+    deleteBlock = destinySheet[model['deleteAreaRange']]
     _deleteCellRange(deleteBlock)
 
     # Save the modified destiny workbook.
     destinyWorkbook.save(filePath)
 
-    # Change the print area.
-    _updatePrintArea(filePath)
-
 def _deleteCellRange(cells):
     for row in cells:
         for cell in row:
             cell.value = ""
 
-def _findCellByContent(excel: openpyxl.worksheet, searchItem: str) -> openpyxl.cell:
+# Finds all the anchor cells in a single sweep over the sheet, stopping as soon as the last one
+# has been seen.
+def _indexAnchors(excel: openpyxl.worksheet, searchItems: set) -> dict:
+    pending = set(searchItems)
+    anchors = {}
     for row in excel.iter_rows():
         for cell in row:
-            if cell.value == searchItem:
-                return cell
-    
-    return None
-
-def _copyRangeToStartingCell(excel: openpyxl.worksheet, data, startingCell: openpyxl.cell):
-    startingCellRow = startingCell.row
-    startingCellCol = startingCell.column
-
-    # Loop through the copy range and paste it to the new location
-    for i, row in enumerate(data):
-        for j in range(len(row)):
-            cell = data[i][j]
-            targetCell = excel.cell(row=startingCellRow + i, column=startingCellCol + j)
-
-            # Set value
-            targetCell.value = cell.value
-
-            # Copy the font
-            if cell.font:
-                targetCell.font = Font(
-                    name=cell.font.name,
-                    size=cell.font.size,
-                    bold=cell.font.bold,
-                    italic=cell.font.italic,
-                    vertAlign=cell.font.vertAlign,
-                    underline=cell.font.underline,
-                    strike=cell.font.strike,
-                    color=cell.font.color
-                )
-            
-            # Copy the fill (background color)
-            if cell.fill:
-                targetCell.fill = PatternFill(
-                    fill_type=cell.fill.fill_type,
-                    start_color=cell.fill.start_color,
-                    end_color=cell.fill.end_color
-                )
-            
-            # Copy the border
-            if cell.border:
-                targetCell.border = Border(
-                    left=cell.border.left,
-                    right=cell.border.right,
-                    top=cell.border.top,
-                    bottom=cell.border.bottom
-                )
-            
-            # Copy the alignment
-            if cell.alignment:
-                targetCell.alignment = Alignment(
-                    horizontal=cell.alignment.horizontal,
-                    vertical=cell.alignment.vertical,
-                    text_rotation=cell.alignment.text_rotation,
-                    wrap_text=cell.alignment.wrap_text,
-                    shrink_to_fit=cell.alignment.shrink_to_fit,
-                    indent=cell.alignment.indent
-                )
-            
-            # Copy the protection
-            if cell.protection:
-                targetCell.protection = Protection(
-                    locked=cell.protection.locked,
-                    hidden=cell.protection.hidden
-                )
+            if cell.value in pending:
+                anchors[cell.value] = cell
+                pending.discard(cell.value)
+                if not pending:
+                    return anchors
+
+    missing = ', '.join(sorted(pending))
+    raise ValueError(f"Anchors not found on the excel model: {missing}")
+
+# Freezes a template range into plain data: the placeholder value plus the cell's StyleArray,
+# detached from the sheet so the range can be pasted over afterwards. Unstyled cells (spacers)
+# store None instead of five default style objects. The style table indices inside a StyleArray
+# are valid in any workbook parsed from the same model bytes, which both the cached model and
+# every destination workbook are.
+def _snapshotBlock(data) -> list:
+    return [[(cell.value, copy(cell._style) if cell.has_style else None) for cell in row]
+            for row in data]
+
+def _pasteBlock(excel: openpyxl.worksheet, block: list, startingRow: int):
+    # Styles are pasted as one StyleArray copy per cell instead of assigning Font/Fill/... one
+    # by one through the property setters, each of which would resolve its object into the
+    # workbook's style table again. Unstyled template cells just reset the target to the
+    # default. The target cells come from one iter_rows sweep over the paste region rather
+    # than a ws.cell coordinate lookup per cell.
+    targetRows = excel.iter_rows(min_row=startingRow, max_row=startingRow + len(block) - 1,
+                                 min_col=1, max_col=len(block[0]))
+    for row, targetRow in zip(block, targetRows):
+        for (value, style), targetCell in zip(row, targetRow):
+            targetCell.value = value
+            targetCell._style = copy(style) if style is not None else None
+
+_placeholderRe = re.compile(r'<(.*?)>')
+
+# The same placeholder snippets repeat on every pasted block, so each distinct one is compiled
+# to bytecode once per program run; rendering only pays for the eval.
+@lru_cache(maxsize=None)
+def _compileSnippet(code: str):
+    return compile(code, '<excel-model>', 'eval')
 
 # This function substitutes the values inputted on the excel file by the real Python variables.
 def _substituteExcelVariable(excel: openpyxl.worksheet, rowStart: int, rowEnd: int, args):
     for row in excel.iter_rows(min_row=rowStart, max_row = rowEnd-1):
         for cell in row:
             value = cell.value
-            if value is None:
+            if type(value) is not str or '<' not in value:
                 continue
 
-            matches = re.findall(r'<(.*?)>', value)
-            for snippet in matches:
-                value = re.sub(r'<.*?>', _evaluateVariable(snippet, args), value, count=1)
+            cell.value = _placeholderRe.sub(
+                lambda match: _evaluateVariable(match.group(1), args), value)
 
-            cell.value = value
+# Removes the possibility to import libraries or use external functions.
+_safeGlobals = {"__builtins__": {}}
 
 def _evaluateVariable(code: str, args):
-    # Removes the possibility to import libraries or use external functions.
-    args["__builtins__"] = {}
-    # Variable to store the output of the code.
-    args["out"] = ""
-    code = "out = " + code
-    
-    # Execute the code using the environment given by args.
-    exec(code, args)
-    out = str(args["out"])
+    # Evaluate the snippet with the environment given by args as its locals; the caller's dict
+    # is left untouched.
+    out = str(eval(_compileSnippet(code), _safeGlobals, args))
 
     # Remove all <> from the output because that will confound the substituteExcelVariable function.
-    return re.sub(r'<.*?>', "", out)
-
-def _updatePrintArea(xlsxPath, newArea="VFR!$A:$B"):
-    # Create a temporary directory to extract files.
-    tempDir = "temp_xlsx"
-    if os.path.exists(tempDir):
-        shutil.rmtree(tempDir)
-    os.makedirs(tempDir)
-
-    # Extract the .xlsx file contents to the temporary directory.
-    with zipfile.ZipFile(xlsxPath, 'r') as zipFile:
-        zipFile.extractall(tempDir)
-
-    # Path to the workbook.xml file. This file contains the print area.
-    wbXmlPath = os.path.join(tempDir, 'xl', 'workbook.xml')
-
-    # Parse and modify the workbook.xml file.
-    tree = ET.parse(wbXmlPath)
-    root = tree.getroot()
-    namespaces = {'ns': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
-
-    # Find the definedName element with name="_xlnm.Print_Area".
-    fieldFound = False
-    for definedNameField in root.findall('.//ns:definedName', namespaces):
-        if definedNameField.get('name') == '_xlnm.Print_Area':
-            # Update its text to the new value.
-            definedNameField.text = newArea
-            fieldFound = True
-            break
-
-    if not fieldFound:
-        print("Set the print area on the excel model.")
-
-    # Write the modified XML back to workbook.xml.
-    tree.write(wbXmlPath, encoding='utf-8', xml_declaration=True)
-
-    # Save file with the modified content.
-    with zipfile.ZipFile(xlsxPath, 'w') as new_zip:
-        for foldername, _, filenames in os.walk(tempDir):
-            for filename in filenames:
-                file_path = os.path.join(foldername, filename)
-                arcname = os.path.relpath(file_path, tempDir)
-                new_zip.write(file_path, arcname)
-
-    # Cleanup the temporary directory.
-    shutil.rmtree(tempDir)
+    return _placeholderRe.sub("", out)
@@ -0,0 +1,88 @@
+# **************************************************************************************************
+# @file TestResultCache.py
+# @brief Cache of test verdicts keyed by a digest of the test inputs. A test whose command,
+# repetitions, validation and expected outputs haven't changed since its last run will produce
+# the same verdict, so it can be answered from here instead of shelling out again.
+#
+# @project   VVToolkit
+# @version   1.0
+# @date      2024-08-21
+# @author    @dabecart
+#
+# @license
+# This project is licensed under the MIT License - see the LICENSE file for details.
+# **************************************************************************************************
+
+from dataclasses import asdict
+from hashlib import blake2b
+import json
+import os
+
+from DataFields import Item, ResultCommand, TestResult
+
+class TestResultCache:
+    # The key is a digest of everything the verdict depends on, so an edit to any of those
+    # inputs makes the item miss the cache on its own: no explicit invalidation hooks needed.
+    # Only the verdict and its outputs are stored, not the full item, to bound the cache size.
+
+    def __init__(self) -> None:
+        self.entries: dict = {}
+
+    def digestForItem(self, item: Item) -> str:
+        validation = item.validationCmd
+        key = [item.runcode, item.repetitions,
+               validation.operation, validation.operator, validation.operatorVal]
+        if validation.usesBuildOutput():
+            # The verdict compares against the build outputs, so they are part of the inputs.
+            key.append([(res.output, res.returnCode) for res in item.result])
+        raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+        return blake2b(raw, digest_size=16).hexdigest()
+
+    # Fills the item's test fields from the cache. Returns True on a hit.
+    def apply(self, item: Item) -> bool:
+        entry = self.entries.get(self.digestForItem(item))
+        if entry is None:
+            return False
+
+        item.testResult = entry['testResult']
+        item.testOutput = [ResultCommand(**res) for res in entry['testOutput']]
+        return True
+
+    def store(self, item: Item) -> None:
+        # Only a completed test is worth remembering.
+        if item.testResult == TestResult.NOTRUN or not item.hasBeenTested():
+            return
+
+        self.entries[self.digestForItem(item)] = {
+            'testResult': item.testResult,
+            'testOutput': [asdict(res) for res in item.testOutput],
+        }
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    # The cache is stored next to the project file, under the same name plus this suffix.
+    @staticmethod
+    def cacheFileOf(projectFile: str) -> str:
+        return projectFile + '.vvcache'
+
+    def saveToFile(self, projectFile: str) -> None:
+        try:
+            with open(TestResultCache.cacheFileOf(projectFile), 'w') as file:
+                json.dump(self.entries, file)
+        except OSError as e:
+            # The cache is an optimization: failing to write it must not break a project save.
+            print(f"Could not save the test result cache: {e}")
+
+    def loadFromFile(self, projectFile: str) -> None:
+        self.entries = {}
+        cacheFile = TestResultCache.cacheFileOf(projectFile)
+        if not os.path.isfile(cacheFile):
+            return
+
+        try:
+            with open(cacheFile, 'r') as file:
+                self.entries = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not load the test result cache: {e}")
+            self.entries = {}
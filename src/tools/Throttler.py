@@ -0,0 +1,39 @@
+# **************************************************************************************************
+# @file Throttler.py
+# @brief Wraps a callable with a timer so bursts of calls coalesce into a single one.
+#
+# @project   VVToolkit
+# @version   1.0
+# @date      2024-08-20
+# @author    @dabecart
+#
+# @license
+# This project is licensed under the MIT License - see the LICENSE file for details.
+# **************************************************************************************************
+
+from PyQt6.QtCore import QTimer
+
+class CallThrottler:
+    # Connect a signal to an instance of this class instead of the final slot. Each invocation
+    # restarts the timer and the wrapped function runs once when the timer expires. Signal
+    # arguments are discarded, so this is meant for slots that re-read the current GUI state
+    # when they run. Used to stop per-keystroke signals from doing a full validation
+    # round-trip on every single character.
+
+    def __init__(self, func, timeout: int = 100):
+        self.func = func
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(timeout)
+        self.timer.timeout.connect(func)
+
+    def __call__(self, *args):
+        self.timer.start()
+
+    def flush(self):
+        # Runs a pending call right away instead of waiting out the timeout; a no-op when
+        # nothing is pending, so callers can flush defensively before reading state the
+        # wrapped function writes.
+        if self.timer.isActive():
+            self.timer.stop()
+            self.func()
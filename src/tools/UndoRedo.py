@@ -1,7 +1,13 @@
+from collections import deque
+
 class UndoRedo:
+    # The history is bounded: past this depth the oldest entries fall off the deque, releasing
+    # their references to items instead of retaining every action of the session.
+    MAX_HISTORY = 500
+
     gui = None
-    undoStack = []
-    redoStack = []
+    undoStack = deque(maxlen=MAX_HISTORY)
+    redoStack = deque(maxlen=MAX_HISTORY)
     cmdCalledFromHere: bool = False
 
     @staticmethod
@@ -0,0 +1,30 @@
+# **************************************************************************************************
+# @file UpdateBlocker.py
+# @brief Used to create a context that suspends widget repaints during bulk GUI changes.
+#
+# @project   VVToolkit
+# @version   1.0
+# @date      2024-08-20
+# @author    @dabecart
+#
+# @license
+# This project is licensed under the MIT License - see the LICENSE file for details.
+# **************************************************************************************************
+
+class UpdateBlocker:
+    # Adding or removing many widgets one by one triggers a layout/repaint pass per widget.
+    # Inside this context the widgets don't repaint, so the whole batch is drawn in one pass
+    # when the context exits.
+
+    def __init__(self, *widgets):
+        self.widgets = widgets
+
+    def __enter__(self):
+        for widget in self.widgets:
+            widget.setUpdatesEnabled(False)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for widget in self.widgets:
+            widget.setUpdatesEnabled(True)
+            widget.update()
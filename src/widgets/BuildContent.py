@@ -12,7 +12,7 @@
 # **************************************************************************************************
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QTextEdit, QComboBox, QLineEdit, QPushButton, QFrame, QSizePolicy)
+                            QPlainTextEdit, QComboBox, QLineEdit, QPushButton, QFrame, QSizePolicy)
 
 from PyQt6.QtCore import Qt, QSize
 
@@ -101,11 +101,15 @@ class BuildContent(QWidget):
         outputHeaderLayout.addStretch()
         outputHeaderLayout.addWidget(self.outputReturnValue)
 
-        self.outputCmdText = QTextEdit()
+        # A plain-text widget: the output never holds rich text, so there is no point paying
+        # for QTextEdit's full document engine, and the block cap bounds memory and layout
+        # work when a command prints a huge output.
+        self.outputCmdText = QPlainTextEdit()
+        self.outputCmdText.setMaximumBlockCount(500)
         self.outputCmdText.setStatusTip('The output generated by this test case.')
         if self.item.hasBeenRun():
             # This will update the text on the output cmd.
-            self.outputCmdText.setText(self.item.result[0].output)
+            self.outputCmdText.setPlainText(self.item.result[0].output)
             self.outputReturnValue.setText(f"Return: {self.item.result[0].returnCode}\nExecution time: {self.item.result[0].executionTime:.2f} ms")
         self.outputCmdText.setReadOnly(True)
 
@@ -125,8 +129,9 @@ class BuildContent(QWidget):
         if not self.item.result:
             return self.outputCmdText.toPlainText() == ""
         else:
-            dummyTextEdit = QTextEdit()
-            dummyTextEdit.setText(self.item.result[int(self.outputCmdIndexCombo.currentText())].output)
+            dummyTextEdit = QPlainTextEdit()
+            dummyTextEdit.setMaximumBlockCount(500)
+            dummyTextEdit.setPlainText(self.item.result[int(self.outputCmdIndexCombo.currentText())].output)
             return (dummyTextEdit.toPlainText() == self.outputCmdText.toPlainText())
     
     def onOutputCmdIndexChanged(self, text):
@@ -136,7 +141,7 @@ class BuildContent(QWidget):
             return
         
         result = self.item.result[index]
-        self.outputCmdText.setText(result.output)
+        self.outputCmdText.setPlainText(result.output)
         self.outputReturnValue.setText(f"Return: {result.returnCode}\nExecution time: {result.executionTime:.2f} ms")
 
     def onCheckingModeChanged(self, text):
@@ -171,7 +176,8 @@ class BuildHeader(QWidget):
         self.runButton.setIcon(icon)
         self.runButton.setFixedSize(35, 35)
         self.runButton.setIconSize(QSize(30,30))
-        self.runButton.clicked.connect(lambda: self.parent.parent.runAction('run-item', 'undo', self.parent.content))
+        # Bound methods instead of lambdas: one slot wrapper per button, no closure per box.
+        self.runButton.clicked.connect(self.onRunClicked)
 
         self.clearButton = QPushButton()
         self.clearButton.setStatusTip('Clears the results of this test case.')
@@ -180,7 +186,13 @@ class BuildHeader(QWidget):
         self.clearButton.setIcon(icon)
         self.clearButton.setFixedSize(35, 35)
         self.clearButton.setIconSize(QSize(30,30))
-        self.clearButton.clicked.connect(lambda: self.parent.parent.runAction('clear-item', 'undo', self.parent.content))
+        self.clearButton.clicked.connect(self.onClearClicked)
 
         layout.addWidget(self.runButton)
-        layout.addWidget(self.clearButton)
\ No newline at end of file
+        layout.addWidget(self.clearButton)
+
+    def onRunClicked(self, checked=False):
+        self.parent.parent.runAction('run-item', 'undo', self.parent.ensureContent())
+
+    def onClearClicked(self, checked=False):
+        self.parent.parent.runAction('clear-item', 'undo', self.parent.ensureContent())
\ No newline at end of file
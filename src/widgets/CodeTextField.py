@@ -31,57 +31,67 @@ class CodeTextField(QTextEdit):
             return None
         return commandText
 
+    # Basic validation to disallow dangerous commands. Compiled once: validation is a single
+    # scan instead of five re.search calls through the module cache.
+    _exclussionPattern = re.compile(r'\brm\b|\bsudo\b|&&|\|\||;')
+
     def _validateCommand(self, command) -> bool:
-        # Basic validation to disallow dangerous commands
-        exclussionPatterns = [r'\brm\b', r'\bsudo\b', r'&&', r'\|\|', r';']
-        for pattern in exclussionPatterns:
-            if re.search(pattern, command):
-                return False
-        return True
+        return self._exclussionPattern.search(command) is None
     
 class BashHighlighter(QSyntaxHighlighter):
+
+    keywords = ["if", "then", "fi", "for", "while", "do", "done", "echo", "exit"]
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlightingRules = []
+
+        # Comment format
+        commentFormat = QTextCharFormat()
+        commentFormat.setForeground(QColor(Qt.GlobalColor.green))
+
+        # String format
+        stringFormat = QTextCharFormat()
+        stringFormat.setForeground(QColor(Qt.GlobalColor.red))
 
         # Command name format (assuming command name is the first word in a line)
         commandNameFormat = QTextCharFormat()
         commandNameFormat.setForeground(QColor(Qt.GlobalColor.magenta))
-        pattern = QRegularExpression("^\\s*\\b\\w+\\b")
-        self.highlightingRules.append((pattern, commandNameFormat))
 
         # Keyword format
         keywordFormat = QTextCharFormat()
         keywordFormat.setForeground(QColor(Qt.GlobalColor.blue))
         keywordFormat.setFontWeight(QFont.Weight.Bold)
-        keywords = ["if", "then", "fi", "for", "while", "do", "done", "echo", "exit"]
-        for keyword in keywords:
-            pattern = QRegularExpression(f"\\b{keyword}\\b")
-            self.highlightingRules.append((pattern, keywordFormat))
-
-        # Comment format
-        commentFormat = QTextCharFormat()
-        commentFormat.setForeground(QColor(Qt.GlobalColor.green))
-        pattern = QRegularExpression("#[^\n]*")
-        self.highlightingRules.append((pattern, commentFormat))
-
-        # String format
-        stringFormat = QTextCharFormat()
-        stringFormat.setForeground(QColor(Qt.GlobalColor.red))
-        pattern = QRegularExpression("\".*\"")
-        self.highlightingRules.append((pattern, stringFormat))
 
         # Inline $ format
         inlineVarFormat = QTextCharFormat()
         inlineVarFormat.setForeground(QColor(Qt.GlobalColor.yellow))
-        pattern = QRegularExpression("\\$\\w+")
-        self.highlightingRules.append((pattern, inlineVarFormat))
+
+        # One alternation scans the line once; the named group that captured decides the format.
+        # The command-name branch excludes the keywords so a keyword in first position still
+        # gets the keyword format.
+        keywordList = "|".join(self.keywords)
+        self.masterRule = QRegularExpression(
+            "(?<cmt>#[^\n]*)"
+            "|(?<str>\"[^\"]*\")"
+            f"|(?<cmd>^\\s*\\b(?!(?:{keywordList})\\b)\\w+\\b)"
+            f"|(?<kw>\\b(?:{keywordList})\\b)"
+            "|(?<var>\\$\\w+)")
+        self.groupFormats = [
+            ('cmt', commentFormat),
+            ('str', stringFormat),
+            ('cmd', commandNameFormat),
+            ('kw',  keywordFormat),
+            ('var', inlineVarFormat),
+        ]
 
     # Overridden function.
     def highlightBlock(self, text):
-        for pattern, format in self.highlightingRules:
-            expression = pattern.globalMatch(text)
-            while expression.hasNext():
-                match = expression.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+        expression = self.masterRule.globalMatch(text)
+        while expression.hasNext():
+            match = expression.next()
+            for group, format in self.groupFormats:
+                start = match.capturedStart(group)
+                if start != -1:
+                    self.setFormat(start, match.capturedLength(group), format)
+                    break
         self.setCurrentBlockState(0)
\ No newline at end of file
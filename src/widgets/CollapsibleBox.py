@@ -16,9 +16,19 @@ from PyQt6.QtGui import QPalette, QColor
 from PyQt6.QtCore import Qt, QPropertyAnimation, QAbstractAnimation
 
 from DataFields import Item
-from Icons import createIcon
+from Icons import createIcon, cachedPixmap
 
 class CollapsibleBox(QWidget):
+    # Stylesheet shared by all boxes, keyed by color theme. Deriving the colors from the palette
+    # costs a handful of Qt calls per box, and populating a table builds many boxes: compute the
+    # sheet once per theme instead.
+    styleSheetCache = {}
+
+    # Closed height shared by all boxes with the same header class and theme. It only depends
+    # on the header's layout, never on the item, so the first box of each kind measures it and
+    # the others skip the layout pass entirely.
+    closedHeightCache = {}
+
     def __init__(self, iconName: str, item: Item, config, contentHeader: type, contentWidget: type, parent=None):
         super().__init__(parent)
 
@@ -27,8 +37,12 @@ class CollapsibleBox(QWidget):
         self.item = item
         self.config = config
         self.parent = parent
-        self.content = contentWidget(self.item, self)
-        self.content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
+
+        # The content widget is by far the most expensive part of a box (text fields, combos,
+        # syntax highlighting) and boxes start collapsed, so it's only built on first expand;
+        # see ensureContent().
+        self.contentWidgetType = contentWidget
+        self.content = None
 
         self.header = QWidget()
         self.header.setStatusTip('Open this collapsible box.')
@@ -38,13 +52,13 @@ class CollapsibleBox(QWidget):
         self.arrowLabel = QLabel()
         icon = createIcon(':arrow-right', self.config)
         icon.setAssociatedWidget(self.arrowLabel)
-        self.arrowLabel.setPixmap(icon.pixmap(15,15))
+        self.arrowLabel.setPixmap(cachedPixmap(icon, ':arrow-right', self.config, 15, 15))
         self.arrowLabel.setFixedWidth(15)
 
         self.iconLabel = QLabel()
         icon = createIcon(iconName, self.config)
         icon.setAssociatedWidget(self.iconLabel)
-        self.iconLabel.setPixmap(icon.pixmap(30, 30))
+        self.iconLabel.setPixmap(cachedPixmap(icon, iconName, self.config, 30, 30))
         
         self.idLabel = QLabel(str(item.id))
         separatorLabel = QLabel("-")
@@ -73,7 +87,6 @@ class CollapsibleBox(QWidget):
         self.mainWidget.setObjectName('mainName')
         self.main_layout = QVBoxLayout()
         self.main_layout.addWidget(self.header)
-        self.main_layout.addWidget(self.content)
         self.mainWidget.setEnabled(self.item.enabled)
 
         self.mainWidget.setLayout(self.main_layout)
@@ -83,82 +96,191 @@ class CollapsibleBox(QWidget):
         self.selfLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.setLayout(self.selfLayout)
 
-        # Calculate the animation heights.
-        self.content.setVisible(True)
-        self.openedHeight = self.mainWidget.sizeHint().height()
-        self.content.setVisible(False)
-        self.closedHeight = self.mainWidget.sizeHint().height()
+        # Calculate the animation heights. The opened height depends on the content widget, so
+        # it is derived in ensureContent() once the content exists.
+        heightKey = (contentHeader, self.config.colorTheme)
+        self.closedHeight = CollapsibleBox.closedHeightCache.get(heightKey)
+        if self.closedHeight is None:
+            self.closedHeight = self.mainWidget.sizeHint().height()
+            CollapsibleBox.closedHeightCache[heightKey] = self.closedHeight
+        self.openedHeight = None
         self.mainWidget.setMaximumHeight(self.closedHeight)
 
-        self.animation = QPropertyAnimation(self.mainWidget, b"maximumHeight")
-        self.animation.setDuration(250)
-        self.animation.finished.connect(self.onAnimationFinished)
+        # The toggle animation fades the content's opacity instead of animating the box height:
+        # a height animation forces a relayout of every sibling box on each frame, while a fade
+        # only repaints and the height changes in a single step per toggle. Created together
+        # with the content in ensureContent().
+        self.animation = None
+
+        # Item signature for which isUpdated() last answered True; see there.
+        self.lastUpdatedSig = None
 
+        # Theme for which the stylesheet was last generated, to skip redundant setStyle calls.
+        self.lastStyleTheme = None
         self.setStyle()
 
-        # Fade in on box creation.
+        # Fade in on box creation. The effect is dropped once the fade ends so it does not nest
+        # with the content's own opacity effect, which Qt's painter cannot compose.
         opacityEffect = QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(opacityEffect)
         self.fadeAnim = QPropertyAnimation(opacityEffect, b'opacity')
         self.fadeAnim.setStartValue(0)
         self.fadeAnim.setEndValue(1)
         self.fadeAnim.setDuration(500)
+        self.fadeAnim.finished.connect(lambda: self.setGraphicsEffect(None))
         self.fadeAnim.start()
 
-    def setStyle(self):
-        midColor: QColor = self.parent.palette().color(QPalette.ColorRole.Window)
-        brightness = (midColor.red() * 0.299 + midColor.green() * 0.587 + midColor.blue() * 0.114) / 255
-        if brightness < 0.5:
-            midColor = midColor.lighter(150)
-            midlightColor = midColor.lighter(150)
-        else:
-            midlightColor = midColor.darker(102) # Not joking but darker() is very broken.
-            midColor = midlightColor.darker(102)
-
-        self.setStyleSheet(f"""
-            #header {{
-                background-color: {midlightColor.name()};
-                border: 1px solid #ccc;
-                padding: 2px;
-                border-radius: 4px;
-            }}
-            #mainName {{
-                background-color: {midColor.name()};
-                border: 1px solid #ccc;
-                border-radius: 4px;
-            }}
-        """)
+    def setStyle(self, theme: str = None):
+        # During the settings window's live preview the application palette already carries the
+        # new theme while this box's config still holds the old one, so the target theme can be
+        # passed in; with no argument (box construction) it comes from the config.
+        if theme is None:
+            theme = self.config.colorTheme
+
+        # The stylesheet only depends on the color theme; don't re-parse it if it's unchanged.
+        if theme == self.lastStyleTheme:
+            return
+        self.lastStyleTheme = theme
+
+        # The sheet is identical for every box, so it is applied once to the parent table:
+        # descendant selectors reach every box's #header and #mainName, and Qt parses and
+        # polishes one sheet per theme instead of one per box.
+        if getattr(self.parent, 'boxStyleTheme', None) == theme:
+            return
+
+        styleSheet = CollapsibleBox.styleSheetCache.get(theme)
+        if styleSheet is None:
+            midColor: QColor = self.parent.palette().color(QPalette.ColorRole.Window)
+            brightness = (midColor.red() * 0.299 + midColor.green() * 0.587 + midColor.blue() * 0.114) / 255
+            if brightness < 0.5:
+                midColor = midColor.lighter(150)
+                midlightColor = midColor.lighter(150)
+            else:
+                midlightColor = midColor.darker(102) # Not joking but darker() is very broken.
+                midColor = midlightColor.darker(102)
+
+            styleSheet = f"""
+                #header {{
+                    background-color: {midlightColor.name()};
+                    border: 1px solid #ccc;
+                    padding: 2px;
+                    border-radius: 4px;
+                }}
+                #mainName {{
+                    background-color: {midColor.name()};
+                    border: 1px solid #ccc;
+                    border-radius: 4px;
+                }}
+            """
+            CollapsibleBox.styleSheetCache[theme] = styleSheet
+
+        self.parent.boxStyleTheme = theme
+        self.parent.setStyleSheet(styleSheet)
     
+    def ensureContent(self):
+        # Builds the content widget on its first use: expanding the box, or an action that needs
+        # to read or write the content's fields. sizeHint() works on hidden widgets, so the
+        # opened height is derived from the content's own hint plus the layout spacing without
+        # ever showing it.
+        if self.content is None:
+            self.content = self.contentWidgetType(self.item, self)
+            self.content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
+            self.content.setVisible(False)
+            self.main_layout.addWidget(self.content)
+            self.openedHeight = self.closedHeight + self.content.sizeHint().height() \
+                                + self.main_layout.spacing()
+            self._attachContentAnimation()
+        return self.content
+
+    def _attachContentAnimation(self):
+        contentEffect = QGraphicsOpacityEffect(self.content)
+        self.content.setGraphicsEffect(contentEffect)
+        self.animation = QPropertyAnimation(contentEffect, b'opacity')
+        self.animation.setDuration(250)
+        self.animation.finished.connect(self.onAnimationFinished)
+
+    def refresh(self, iconName: str):
+        # Update the box in place after its item has been run again: swap the header icon and
+        # rebuild the content widget, keeping the open/collapsed state. Much cheaper than
+        # destroying the box and inserting a new one into the scroll layout.
+        icon = createIcon(iconName, self.config)
+        icon.setAssociatedWidget(self.iconLabel)
+        self.iconLabel.setPixmap(cachedPixmap(icon, iconName, self.config, 30, 30))
+
+        self.idLabel.setText(str(self.item.id))
+        self.nameLabel.setText(self.item.name)
+
+        # A never-built content stays unbuilt: the first expand will construct it from the
+        # item's current state anyway.
+        if self.content is not None:
+            wasOpened = self.content.isVisible()
+            oldContent = self.content
+            self.content = type(oldContent)(self.item, self)
+            self.content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum)
+            self.main_layout.replaceWidget(oldContent, self.content)
+            oldContent.deleteLater()
+
+            # Recompute the animation heights for the new content, from the hints as in
+            # ensureContent().
+            self.content.setVisible(wasOpened)
+            self.openedHeight = self.closedHeight + self.content.sizeHint().height() \
+                                + self.main_layout.spacing()
+            self.mainWidget.setMaximumHeight(self.openedHeight if wasOpened
+                                             else self.closedHeight)
+            self._attachContentAnimation()
+
+        self.mainWidget.setEnabled(self.item.enabled)
+        self.lastUpdatedSig = None
+
     def toggleContent(self, event):
-        if self.animation.state() == QAbstractAnimation.State.Running:
+        if self.animation is not None \
+           and self.animation.state() == QAbstractAnimation.State.Running:
             return
-        
+
+        self.ensureContent()
         if self.content.isVisible():
-            # Close the window.
+            # Close the box: fade the content out; the height snaps shut once, in
+            # onAnimationFinished.
             self.header.setStatusTip('Open this collapsible box.')
-            icon = createIcon(':arrow-right', self.config)
-            self.animation.setStartValue(self.openedHeight)
-            self.animation.setEndValue(self.closedHeight)
+            arrowName = ':arrow-right'
+            icon = createIcon(arrowName, self.config)
+            self.animation.setStartValue(1.0)
+            self.animation.setEndValue(0.0)
             self.animation.start()
         else:
-            # Open the window.
+            # Open the box: one relayout up front, then fade the content in.
             self.header.setStatusTip('Close this collapsible box.')
-            icon = createIcon(':arrow-down', self.config)
+            arrowName = ':arrow-down'
+            icon = createIcon(arrowName, self.config)
+            self.mainWidget.setMaximumHeight(self.openedHeight)
             self.content.setVisible(True)
-            self.animation.setStartValue(self.closedHeight)
-            self.animation.setEndValue(self.openedHeight)
+            self.animation.setStartValue(0.0)
+            self.animation.setEndValue(1.0)
             self.animation.start()
 
         icon.setAssociatedWidget(self.arrowLabel)
-        self.arrowLabel.setPixmap(icon.pixmap(15,15))
+        self.arrowLabel.setPixmap(cachedPixmap(icon, arrowName, self.config, 15, 15))
 
     def onAnimationFinished(self):
-        # Hide the content once the animation finishes.
-        if self.animation.endValue() == self.closedHeight:
+        # Once faded out, hide the content and collapse the box in a single height change.
+        if self.animation.endValue() == 0.0:
             self.content.setVisible(False)
+            self.mainWidget.setMaximumHeight(self.closedHeight)
 
     def isUpdated(self):
-        return (self.idLabel.text() == str(self.item.id)) \
+        # This runs on every GUI poll and the full check descends into the content widget, which
+        # in build mode round-trips the output text through a throwaway QTextEdit. Short-circuit
+        # when nothing the comparison reads from the item has changed since it last answered
+        # True. Only True is cached: a stale box must keep reporting stale until it's rebuilt.
+        sig = (self.item.id, self.item.name, self.item.enabled,
+               self.item.runcode, self.item.repetitions,
+               tuple(res.output for res in self.item.result))
+        if sig == self.lastUpdatedSig:
+            return True
+
+        updated = (self.idLabel.text() == str(self.item.id)) \
                 and (self.nameLabel.text() == self.item.name) \
-                and self.content.isUpdated() \
-                and (self.mainWidget.isEnabled() == self.item.enabled)
\ No newline at end of file
+                and (self.content is None or self.content.isUpdated()) \
+                and (self.mainWidget.isEnabled() == self.item.enabled)
+        self.lastUpdatedSig = sig if updated else None
+        return updated
\ No newline at end of file
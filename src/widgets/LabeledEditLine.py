@@ -25,6 +25,12 @@ class LabeledLineEdit(QWidget):
         if validator is not None:
             self.lineEdit.setValidator(validator)
 
+        # The error highlight is driven by a dynamic property: the sheet with the property
+        # selector is parsed once here, and setError/clearError only flip the property and
+        # repolish, instead of handing the style engine a new stylesheet per validation.
+        self.lineEdit.setProperty("invalid", False)
+        self.lineEdit.setStyleSheet('QLineEdit[invalid="true"] { background-color: red; }')
+
         self.errorLabel = QLabel("", self)
         self.errorLabel.setStyleSheet("color: red; margin: 0px;")
         
@@ -36,14 +42,22 @@ class LabeledLineEdit(QWidget):
         self.errorLabel.hide()  
 
     def setError(self, error_text):
-        self.lineEdit.setStyleSheet("background-color: red;")
+        self.setInvalid(True)
         self.errorLabel.setText(error_text)
         self.errorLabel.show()
 
     def clearError(self):
-        self.lineEdit.setStyleSheet("")
+        self.setInvalid(False)
         self.errorLabel.hide()
 
+    def setInvalid(self, invalid: bool):
+        if self.lineEdit.property("invalid") == invalid:
+            return
+        self.lineEdit.setProperty("invalid", invalid)
+        # Re-evaluates the property selector without reparsing any stylesheet.
+        self.lineEdit.style().unpolish(self.lineEdit)
+        self.lineEdit.style().polish(self.lineEdit)
+
     def text(self):
         return self.lineEdit.text()
 
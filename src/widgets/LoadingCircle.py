@@ -11,55 +11,88 @@
 # This project is licensed under the MIT License - see the LICENSE file for details.
 # **************************************************************************************************
 
-from PyQt6.QtWidgets import (QLabel, QGraphicsView, QGraphicsScene, QGraphicsProxyWidget, QSizePolicy)
-from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, Qt
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QPointF, QSize, Qt, pyqtProperty
 from PyQt6.QtGui import QPainter
-from math import erf
+from Icons import createIcon, cachedPixmap
 
-from Icons import createIcon
+class LoadingCircle(QWidget):
+    # A plain widget that rotates one pixmap in paintEvent. Each animation frame is a transform
+    # and a drawPixmap, instead of routing a proxy widget through a whole
+    # QGraphicsView/QGraphicsScene pipeline.
 
-class LoadingCircle(QGraphicsView):
     def __init__(self, sizeX: int, sizeY: int):
         super(LoadingCircle, self).__init__()
 
-        self.setStyleSheet("border-width: 0px; background-color: transparent;")
+        self.sizeX = sizeX
+        self.sizeY = sizeY
         # Give a little margin so that it's not scrollable.
         self.setFixedHeight(sizeY+10)
 
-        scene = QGraphicsScene(self)
-        self.setScene(scene)
-        scene.setSceneRect(0, 0, sizeX, sizeY)  # Match scene size to view size
-
-        label = QLabel("")
-        label.setPixmap(createIcon(':loading').pixmap(sizeX,sizeY))
-
-        self.proxy = QGraphicsProxyWidget()
-        self.proxy.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        # Center the proxy widget in the scene
-        self.proxy.setPos((sizeX - self.proxy.boundingRect().width()) / 2, 
-                          (sizeY - self.proxy.boundingRect().height()) / 2)
-        self.proxy.setWidget(label)
-        self.proxy.setTransformOriginPoint(self.proxy.boundingRect().center())
-        scene.addItem(self.proxy)
-
-        self.setRenderHints(self.renderHints() | QPainter.RenderHint.SmoothPixmapTransform)
-        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.NoAnchor)
-        self.setResizeAnchor(QGraphicsView.ViewportAnchor.NoAnchor)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setSceneRect(0, 0, sizeX, sizeY)  # Set the view's scene rect to match
-
-        self.anim = QPropertyAnimation(self.proxy, b"rotation")
+        self.pixmap = cachedPixmap(createIcon(':loading'), ':loading', None, sizeX, sizeY)
+        self.alignment = Qt.AlignmentFlag.AlignHCenter
+        self.rotationAngle = 0.0
+
+        self.anim = QPropertyAnimation(self, b"angle")
         # Loop indefinitely.
         self.anim.setLoopCount(-1)
-        
-        curve = QEasingCurve()
-        # This behemoth of a function comes from integrating f(x) = 0.4 + 0.6*exp(-22.2222*(-0.5 + x)^2)
-        # It's a gaussian curve with a little continuous value added. This is the rotatory speed of 
-        # the circle. To calculate its angular position, this function is integrated. Then the 
-        # primitive F(x) is normalized between [0,1]: (F(x) - F(0)) / (F(1) - F(0))
-        curve.setCustomType(lambda x: 0.180206 + 0.639588*x + 0.180361*erf(4.71405*(-0.5 + x)))
+
+        curve = QEasingCurve(QEasingCurve.Type.BezierSpline)
+        # The original curve came from integrating f(x) = 0.4 + 0.6*exp(-22.2222*(-0.5 + x)^2)
+        # (a gaussian rotatory speed with a little continuous value added), normalizing the
+        # primitive between [0,1]: 0.180206 + 0.639588*x + 0.180361*erf(4.71405*(-0.5 + x)).
+        # A custom-type curve calls back into Python on every animation tick, forever; this
+        # cubic Bezier was fitted to the same S-curve (max deviation 0.004, about 1.5 degrees
+        # of rotation) and Qt evaluates it entirely in C++.
+        curve.addCubicBezierSegment(QPointF(0.57, 0.32), QPointF(0.43, 0.68), QPointF(1.0, 1.0))
         self.anim.setEasingCurve(curve)
         self.anim.setStartValue(0)
         self.anim.setEndValue(360)
         self.anim.setDuration(2000)
-        self.anim.start()
\ No newline at end of file
+        # The animation only runs while the spinner is on screen; see showEvent/hideEvent.
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.anim.state() == QPropertyAnimation.State.Paused:
+            self.anim.resume()
+        elif self.anim.state() == QPropertyAnimation.State.Stopped:
+            self.anim.start()
+
+    def hideEvent(self, event):
+        # A hidden spinner costs nothing: no ticks, no repaints.
+        super().hideEvent(event)
+        if self.anim.state() == QPropertyAnimation.State.Running:
+            self.anim.pause()
+
+    def getAngle(self) -> float:
+        return self.rotationAngle
+
+    def setAngle(self, angle: float):
+        self.rotationAngle = angle
+        self.update()
+
+    # The animated property: updating it only schedules a repaint of this widget.
+    angle = pyqtProperty(float, getAngle, setAngle)
+
+    def setAlignment(self, alignment: Qt.AlignmentFlag):
+        self.alignment = alignment
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(self.sizeX + 10, self.sizeY + 10)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        if self.alignment & Qt.AlignmentFlag.AlignLeft:
+            centerX = self.sizeX/2 + 5
+        elif self.alignment & Qt.AlignmentFlag.AlignRight:
+            centerX = self.width() - self.sizeX/2 - 5
+        else:
+            centerX = self.width()/2
+
+        painter.translate(centerX, self.height()/2)
+        painter.rotate(self.rotationAngle)
+        painter.drawPixmap(-self.pixmap.width()//2, -self.pixmap.height()//2, self.pixmap)
+        painter.end()
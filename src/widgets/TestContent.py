@@ -12,23 +12,58 @@
 # **************************************************************************************************
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QTextEdit, QComboBox, QPushButton, QFrame)
+                            QPlainTextEdit, QComboBox, QPushButton, QFrame)
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPainter, QPixmap, QColor, QIcon, QStandardItem, QStandardItemModel
+from PyQt6.QtGui import QPainter, QPixmap, QColor, QIcon
 
 from DataFields import Item
 from widgets.CodeTextField import CodeTextField
-from widgets.ContainerWidget import ContainerWidget
 from DataFields import TestResult
 
 from Icons import createIcon
 
+# Colored-dot icons for the iteration combo, keyed by TestResult. There are only a handful of
+# distinct results, so each dot is painted once per process instead of once per iteration of
+# every test case.
+_resultIconCache = {}
+
+def _resultIcon(result) -> QIcon:
+    icon = _resultIconCache.get(result)
+    if icon is None:
+        color = QColor(TestResult.getResultColor(result))
+
+        # Create a pixmap with a colored dot.
+        pixmap = QPixmap(20, 20)
+        pixmap.fill(QColor("transparent"))
+
+        painter = QPainter(pixmap)
+        painter.setBrush(color)
+        painter.setPen(color)
+        painter.drawEllipse(3, 3, 14, 14)
+        painter.end()
+
+        icon = QIcon(pixmap)
+        _resultIconCache[result] = icon
+    return icon
+
 class TestContent(QWidget):
+    # Minimum width of the iteration combo, measured once: the hint only depends on the style
+    # and font, and computing it walks both for every content widget otherwise.
+    comboMinWidth = None
+
     def __init__(self, item: Item, parent = None) -> None:
         super().__init__(parent)
 
         self.item = item
         self.parent = parent
+        # Resolved once: the validation command never changes while the content exists, and
+        # updateReturnValues checks this on every selection change.
+        self.usesBuildOutput = item.validationCmd.usesBuildOutput()
+
+        # The constructor adds a dozen child widgets and fills several of them with text; keep
+        # update scheduling off until everything is in place so Qt coalesces the layout and
+        # paint work into one pass at the end.
+        self.setUpdatesEnabled(False)
 
         contentLayout = QVBoxLayout(self)
         contentLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -43,35 +78,25 @@ class TestContent(QWidget):
         self.outputCmdIndexCombo.setStatusTip("Select which of the iterations to show.")
         self.outputCmdIndexCombo.setPlaceholderText("None")
         self.outputCmdIndexCombo.setMinimumHeight(30)
-        self.outputCmdIndexCombo.setMinimumWidth(self.outputCmdIndexCombo.sizeHint().width() + 16)
+        if TestContent.comboMinWidth is None:
+            TestContent.comboMinWidth = self.outputCmdIndexCombo.sizeHint().width() + 16
+        self.outputCmdIndexCombo.setMinimumWidth(TestContent.comboMinWidth)
 
         # Add a little colored dot along with the output number to signal the output result.
-        ouputCmdIndexComboContent = [(str(i), self.item.testOutput[i].result) for i in range(self.item.repetitions)]
-        model = QStandardItemModel(self.outputCmdIndexCombo)
-        for text, result in ouputCmdIndexComboContent:
-            color = QColor(TestResult.getResultColor(result))
-
-            # Create a pixmap with a colored dot.
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(QColor("transparent"))
-
-            painter = QPainter(pixmap)
-            painter.setBrush(color)
-            painter.setPen(color)
-            painter.drawEllipse(3, 3, 14, 14)
-            painter.end()
-
-            # Create the QStandardItem with the icon and text.
-            model.appendRow(QStandardItem(QIcon(pixmap), text))
-        
-        self.outputCmdIndexCombo.setModel(model)
-        
+        # One addItems call inserts every row at once on the combo's own model; the cached dot
+        # icons are attached afterwards, with no per-row QStandardItem allocation.
+        self.outputCmdIndexCombo.addItems([str(i) for i in range(self.item.repetitions)])
+        for i in range(self.item.repetitions):
+            self.outputCmdIndexCombo.setItemIcon(i, _resultIcon(self.item.testOutput[i].result))
+
         if self.item.hasBeenRun():
             self.outputCmdIndexCombo.setCurrentIndex(0)
         else:
             self.outputCmdIndexCombo.setCurrentIndex(-1)
             self.outputCmdIndexCombo.setEnabled(False)
-        self.outputCmdIndexCombo.currentTextChanged.connect(self.onOutputCmdIndexChanged)
+        # currentIndexChanged hands over the index directly: no string allocation and parse
+        # per selection change.
+        self.outputCmdIndexCombo.currentIndexChanged.connect(self.updateReturnValues)
 
         checkModeLabel = QLabel(f"Checking Mode: {self.item.validationCmd.validationToString(self.item.testResult)}")
 
@@ -83,15 +108,18 @@ class TestContent(QWidget):
         iterationOutputCommandLabel = QLabel("Iteration output:")
         self.testOutputReturnValue = QLabel("")
 
-        iterationOutputHeader = ContainerWidget()
-        iterationOutputHeaderLayout = QHBoxLayout(iterationOutputHeader)
+        # A bare layout nested with addLayout: the header needs no widget of its own to host it.
+        iterationOutputHeaderLayout = QHBoxLayout()
         iterationOutputHeaderLayout.setContentsMargins(0,0,0,0)
         iterationOutputHeaderLayout.addWidget(iterationOutputCommandLabel)
         iterationOutputHeaderLayout.addWidget(self.outputCmdIndexCombo)
         iterationOutputHeaderLayout.addStretch()
         iterationOutputHeaderLayout.addWidget(self.testOutputReturnValue)
 
-        self.iterationOutputCmdText = QTextEdit()
+        # Plain-text widgets with a block cap, as in the build content: the outputs are never
+        # rich text and can be arbitrarily long.
+        self.iterationOutputCmdText = QPlainTextEdit()
+        self.iterationOutputCmdText.setMaximumBlockCount(500)
         self.iterationOutputCmdText.setStatusTip('The output generated by this test\'s iteration.')
         self.iterationOutputCmdText.setReadOnly(True)
 
@@ -107,7 +135,7 @@ class TestContent(QWidget):
         contentLayout.addWidget(self.inputCmdText)
         contentLayout.addWidget(checkModeLabel)
         contentLayout.addWidget(upperHorizontalSeparator)
-        contentLayout.addWidget(iterationOutputHeader)
+        contentLayout.addLayout(iterationOutputHeaderLayout)
         contentLayout.addWidget(self.iterationOutputCmdText)
         contentLayout.addWidget(self.iterationOutputCmdValidation)
         contentLayout.addWidget(lowerHorizontalSeparator)
@@ -118,49 +146,70 @@ class TestContent(QWidget):
             rerunLabel = QLabel(f"This test was repeated {self.item.wasTestRepeated} time{plural}.")
             contentLayout.addWidget(rerunLabel)
 
-        if self.item.validationCmd.usesBuildOutput():
+        if self.usesBuildOutput:
             outputCommandLabel = QLabel("Original output:")
             self.outputReturnValue = QLabel("")
 
-            outputHeader = ContainerWidget()
-            outputHeaderLayout = QHBoxLayout(outputHeader)
+            outputHeaderLayout = QHBoxLayout()
             outputHeaderLayout.setContentsMargins(0,0,0,0)
             outputHeaderLayout.addWidget(outputCommandLabel)
             outputHeaderLayout.addStretch()
             outputHeaderLayout.addWidget(self.outputReturnValue)
 
-            self.outputCmdText = QTextEdit()
+            self.outputCmdText = QPlainTextEdit()
+            self.outputCmdText.setMaximumBlockCount(500)
             self.outputCmdText.setStatusTip('The original output generated by this test case.')
             self.outputCmdText.setReadOnly(True)
 
-            contentLayout.addWidget(outputHeader)
+            contentLayout.addLayout(outputHeaderLayout)
             contentLayout.addWidget(self.outputCmdText)
 
         # Populate the test output boxes.
+        self.lastShownIndex = None
+        # Formatted label strings per iteration, built on first display; see updateReturnValues.
+        self.labelCache = {}
         self.updateReturnValues(0)
 
-    def updateReturnValues(self, index):
-        # This will update the text on the output commands and the result.
-        if self.item.hasBeenTested():
-            self.iterationOutputCmdText.setText(self.item.testOutput[index].output)
-            self.testOutputReturnValue.setText(f"Return: {self.item.testOutput[index].returnCode}\nExecution time: {self.item.testOutput[index].executionTime:.2f} ms")
-            self.iterationOutputCmdValidation.setText(f"Iteration results: {self.item.validationCmd.resultToString(self.item.testOutput[index].result)}")
+        self.setUpdatesEnabled(True)
 
-        if self.item.validationCmd.usesBuildOutput() and self.item.hasBeenRun():
-            self.outputCmdText.setText(self.item.result[index].output)
-            self.outputReturnValue.setText(f"Return: {self.item.result[index].returnCode}\nExecution time: {self.item.result[index].executionTime:.2f} ms")
+    def updateReturnValues(self, index):
+        # This will update the text on the output commands and the result. Reselecting the
+        # iteration that is already shown would rebuild the same documents; skip it.
+        if index < 0 or index == self.lastShownIndex:
+            return
+        self.lastShownIndex = index
+
+        item = self.item
+        hasBeenTested = item.hasBeenTested()
+        showOriginal = self.usesBuildOutput and item.hasBeenRun()
+
+        # The float formatting of the labels is only done the first time an iteration is
+        # shown; navigating back to it reuses the cached strings.
+        labels = self.labelCache.get(index)
+        if labels is None:
+            labels = []
+            if hasBeenTested:
+                testOutput = item.testOutput[index]
+                labels.append(f"Return: {testOutput.returnCode}\nExecution time: {testOutput.executionTime:.2f} ms")
+                labels.append(f"Iteration results: {item.validationCmd.resultToString(testOutput.result)}")
+            if showOriginal:
+                result = item.result[index]
+                labels.append(f"Return: {result.returnCode}\nExecution time: {result.executionTime:.2f} ms")
+            self.labelCache[index] = labels
+
+        if hasBeenTested:
+            self.iterationOutputCmdText.setPlainText(item.testOutput[index].output)
+            self.testOutputReturnValue.setText(labels[0])
+            self.iterationOutputCmdValidation.setText(labels[1])
+
+        if showOriginal:
+            self.outputCmdText.setPlainText(item.result[index].output)
+            self.outputReturnValue.setText(labels[-1])
 
     def isUpdated(self):
         # Legacy code to match BuildContent.py
         return True
     
-    def onOutputCmdIndexChanged(self, text):
-        try:
-            index = int(text)
-        except ValueError:
-            return
-        
-        self.updateReturnValues(index)
 
 class TestHeader(QWidget):
     def __init__(self, parent = None) -> None: